@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for running the Browser-Use MCP server with Uvicorn workers.
+
+Usage:
+    gunicorn -c gunicorn_conf.py server:starlette_app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 3000)}"
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Browser sessions and agents live in process memory, so a session created in
+# one worker is invisible to the others. Only raise WEB_CONCURRENCY when
+# clients do not depend on session state across requests.
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+# Agent tasks can run for minutes; don't let the arbiter kill busy workers
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 300))
+graceful_timeout = 30
+keepalive = 75
@@ -9,10 +9,11 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import asyncio
+import hmac
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Union
 from datetime import datetime
 
 import mcp.types as types
@@ -21,9 +22,9 @@ from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.routing import Route
 from starlette.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.requests import Request
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.datastructures import QueryParams
 
 from browser_use import Agent, Browser, BrowserConfig
 
@@ -37,28 +38,60 @@ ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
+APP_DEBUG = os.environ.get("APP_DEBUG", "0") == "1"
+
+# Precomputed credentials for constant-time comparison in ApiKeyAuthMiddleware
+BEARER_EXPECTED = f"Bearer {API_KEY}".encode()
+API_KEY_BYTES = API_KEY.encode()
+UNAUTHORIZED_RESPONSE = JSONResponse({"detail": "Unauthorized"}, status_code=401)
+
+class ToolEntry(NamedTuple):
+    """A registered tool: its MCP definition and the coroutine that runs it."""
+    definition: types.Tool
+    handler: Callable[..., Awaitable[List[types.TextContent]]]
+
 
 # Global browser manager
 browser_manager = {}
 agent_manager = {}
 
 
-class ApiKeyAuthMiddleware(BaseHTTPMiddleware):
-    """API Key authentication middleware."""
+def get_header(scope, name: bytes) -> Optional[bytes]:
+    """Return the first raw value of a lowercase header from an ASGI scope."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+class ApiKeyAuthMiddleware:
+    """API Key authentication middleware.
     
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in ["/health"]:
-            return await call_next(request)
+    Plain ASGI rather than BaseHTTPMiddleware, so exempt paths such as
+    /health pass straight through without building a Request.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
         
-        auth = request.headers.get("authorization")
-        if auth and auth == f"Bearer {API_KEY}":
-            return await call_next(request)
+        # Check the header first, then fall back to the api_key query param;
+        # proxies may add an Authorization header of their own
+        auth = get_header(scope, b"authorization")
+        if auth is not None and hmac.compare_digest(auth, BEARER_EXPECTED):
+            await self.app(scope, receive, send)
+            return
         
-        api_key = request.query_params.get("api_key")
-        if api_key and api_key == API_KEY:
-            return await call_next(request)
+        api_key = QueryParams(scope["query_string"]).get("api_key")
+        if api_key and hmac.compare_digest(api_key.encode(), API_KEY_BYTES):
+            await self.app(scope, receive, send)
+            return
         
-        return JSONResponse({"detail": "Unauthorized"}, status_code=401)
+        await UNAUTHORIZED_RESPONSE(scope, receive, send)
 
 
 def create_app(port: int = 3000):
@@ -106,13 +139,26 @@ def create_app(port: int = 3000):
     # Register session management tools
     register_session_tools(tool_registry)
     
+    # The registry is fixed from here on, so build the lookups and tools/list
+    # payloads once
+    tool_handlers = {name: entry.handler for name, entry in tool_registry.items()}
+    tool_definitions = [entry.definition for entry in tool_registry.values()]
+    tools_list = [
+        {
+            "name": tool_def.name,
+            "description": tool_def.description,
+            "inputSchema": tool_def.inputSchema
+        }
+        for tool_def in tool_definitions
+    ]
+    
     # Consolidated call_tool handler
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
-        if name not in tool_registry:
+        handler = tool_handlers.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
         
-        handler = tool_registry[name]["handler"]
         try:
             return await handler(**arguments)
         except Exception as e:
@@ -125,10 +171,7 @@ def create_app(port: int = 3000):
     # Consolidated list_tools handler
     @server.list_tools()
     async def list_tools() -> list[types.Tool]:
-        tools = []
-        for tool_name, tool_info in tool_registry.items():
-            tools.append(tool_info["definition"])
-        return tools
+        return tool_definitions
     
     # Set up SSE transport
     sse = SseServerTransport("/messages/")
@@ -168,26 +211,18 @@ def create_app(port: int = 3000):
                 return JSONResponse({"jsonrpc": "2.0", "id": request_id, "result": {}})
             
             elif method == 'tools/list':
-                tools = []
-                for name, tool_data in tool_registry.items():
-                    tool_def = tool_data["definition"]
-                    tools.append({
-                        "name": tool_def.name,
-                        "description": tool_def.description,
-                        "inputSchema": tool_def.inputSchema
-                    })
-                
                 return JSONResponse({
                     "jsonrpc": "2.0",
                     "id": request_id,
-                    "result": {"tools": tools}
+                    "result": {"tools": tools_list}
                 })
             
             elif method == 'tools/call':
                 tool_name = params.get('name')
                 arguments = params.get('arguments', {})
                 
-                if tool_name not in tool_registry:
+                handler = tool_handlers.get(tool_name)
+                if handler is None:
                     return JSONResponse({
                         "jsonrpc": "2.0",
                         "id": request_id,
@@ -195,7 +230,6 @@ def create_app(port: int = 3000):
                     })
                 
                 try:
-                    handler = tool_registry[tool_name]["handler"]
                     result = await handler(**arguments)
                     
                     # Convert result to proper format
@@ -237,7 +271,7 @@ def create_app(port: int = 3000):
     
     # Create Starlette app
     starlette_app = Starlette(
-        debug=True,
+        debug=APP_DEBUG,
         routes=[
             Route("/mcp", endpoint=handle_mcp_request, methods=["POST"]),
             Route("/health", endpoint=health_check),
@@ -248,19 +282,20 @@ def create_app(port: int = 3000):
                 "allow_origins": ["*"],
                 "allow_methods": ["*"],
                 "allow_headers": ["*"],
-            })
+            }),
+            (GZipMiddleware, [], {"minimum_size": 512})
         ]
     )
     
     return starlette_app
 
 
-def register_browser_tools(tool_registry: Dict[str, Any]):
+def register_browser_tools(tool_registry: Dict[str, ToolEntry]):
     """Register browser control tools."""
     
     # Create browser session
-    tool_registry["create_browser_session"] = {
-        "definition": types.Tool(
+    tool_registry["create_browser_session"] = ToolEntry(
+        definition=types.Tool(
             name="create_browser_session",
             description="Create a new browser session for automation",
             inputSchema={
@@ -295,12 +330,12 @@ def register_browser_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": create_browser_session
-    }
+        handler=create_browser_session
+    )
     
     # Close browser session
-    tool_registry["close_browser_session"] = {
-        "definition": types.Tool(
+    tool_registry["close_browser_session"] = ToolEntry(
+        definition=types.Tool(
             name="close_browser_session",
             description="Close a browser session",
             inputSchema={
@@ -314,12 +349,12 @@ def register_browser_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": close_browser_session
-    }
+        handler=close_browser_session
+    )
     
     # Navigate to URL
-    tool_registry["navigate_to_url"] = {
-        "definition": types.Tool(
+    tool_registry["navigate_to_url"] = ToolEntry(
+        definition=types.Tool(
             name="navigate_to_url",
             description="Navigate to a specific URL",
             inputSchema={
@@ -342,12 +377,12 @@ def register_browser_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "url"]
             }
         ),
-        "handler": navigate_to_url
-    }
+        handler=navigate_to_url
+    )
     
     # Get page content
-    tool_registry["get_page_content"] = {
-        "definition": types.Tool(
+    tool_registry["get_page_content"] = ToolEntry(
+        definition=types.Tool(
             name="get_page_content",
             description="Get the current page content (HTML, text, or screenshot)",
             inputSchema={
@@ -372,16 +407,16 @@ def register_browser_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": get_page_content
-    }
+        handler=get_page_content
+    )
 
 
-def register_agent_tools(tool_registry: Dict[str, Any]):
+def register_agent_tools(tool_registry: Dict[str, ToolEntry]):
     """Register AI agent tools."""
     
     # Create agent
-    tool_registry["create_agent"] = {
-        "definition": types.Tool(
+    tool_registry["create_agent"] = ToolEntry(
+        definition=types.Tool(
             name="create_agent",
             description="Create an AI agent for browser automation",
             inputSchema={
@@ -419,12 +454,12 @@ def register_agent_tools(tool_registry: Dict[str, Any]):
                 "required": ["agent_id", "session_id"]
             }
         ),
-        "handler": create_agent
-    }
+        handler=create_agent
+    )
     
     # Execute agent task
-    tool_registry["execute_agent_task"] = {
-        "definition": types.Tool(
+    tool_registry["execute_agent_task"] = ToolEntry(
+        definition=types.Tool(
             name="execute_agent_task",
             description="Execute a task using the AI agent",
             inputSchema={
@@ -447,12 +482,12 @@ def register_agent_tools(tool_registry: Dict[str, Any]):
                 "required": ["agent_id", "task"]
             }
         ),
-        "handler": execute_agent_task
-    }
+        handler=execute_agent_task
+    )
     
     # Get agent history
-    tool_registry["get_agent_history"] = {
-        "definition": types.Tool(
+    tool_registry["get_agent_history"] = ToolEntry(
+        definition=types.Tool(
             name="get_agent_history",
             description="Get the action history for an agent",
             inputSchema={
@@ -471,16 +506,16 @@ def register_agent_tools(tool_registry: Dict[str, Any]):
                 "required": ["agent_id"]
             }
         ),
-        "handler": get_agent_history
-    }
+        handler=get_agent_history
+    )
 
 
-def register_session_tools(tool_registry: Dict[str, Any]):
+def register_session_tools(tool_registry: Dict[str, ToolEntry]):
     """Register session management tools."""
     
     # List active sessions
-    tool_registry["list_active_sessions"] = {
-        "definition": types.Tool(
+    tool_registry["list_active_sessions"] = ToolEntry(
+        definition=types.Tool(
             name="list_active_sessions",
             description="List all active browser sessions and agents",
             inputSchema={
@@ -488,12 +523,12 @@ def register_session_tools(tool_registry: Dict[str, Any]):
                 "properties": {}
             }
         ),
-        "handler": list_active_sessions
-    }
+        handler=list_active_sessions
+    )
     
     # Get session info
-    tool_registry["get_session_info"] = {
-        "definition": types.Tool(
+    tool_registry["get_session_info"] = ToolEntry(
+        definition=types.Tool(
             name="get_session_info",
             description="Get detailed information about a session",
             inputSchema={
@@ -507,8 +542,8 @@ def register_session_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": get_session_info
-    }
+        handler=get_session_info
+    )
 
 
 # Tool handler implementations
@@ -881,12 +916,12 @@ async def get_session_info(session_id: str) -> list[types.TextContent]:
         )]
 
 
-def register_navigation_tools(tool_registry: Dict[str, Any]):
+def register_navigation_tools(tool_registry: Dict[str, ToolEntry]):
     """Register navigation tools."""
     
     # Go back
-    tool_registry["go_back"] = {
-        "definition": types.Tool(
+    tool_registry["go_back"] = ToolEntry(
+        definition=types.Tool(
             name="go_back",
             description="Navigate back in browser history",
             inputSchema={
@@ -900,12 +935,12 @@ def register_navigation_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": go_back
-    }
+        handler=go_back
+    )
     
     # Go forward
-    tool_registry["go_forward"] = {
-        "definition": types.Tool(
+    tool_registry["go_forward"] = ToolEntry(
+        definition=types.Tool(
             name="go_forward",
             description="Navigate forward in browser history",
             inputSchema={
@@ -919,12 +954,12 @@ def register_navigation_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": go_forward
-    }
+        handler=go_forward
+    )
     
     # Refresh page
-    tool_registry["refresh_page"] = {
-        "definition": types.Tool(
+    tool_registry["refresh_page"] = ToolEntry(
+        definition=types.Tool(
             name="refresh_page",
             description="Refresh the current page",
             inputSchema={
@@ -938,16 +973,16 @@ def register_navigation_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": refresh_page
-    }
+        handler=refresh_page
+    )
 
 
-def register_interaction_tools(tool_registry: Dict[str, Any]):
+def register_interaction_tools(tool_registry: Dict[str, ToolEntry]):
     """Register interaction tools."""
     
     # Click element
-    tool_registry["click_element"] = {
-        "definition": types.Tool(
+    tool_registry["click_element"] = ToolEntry(
+        definition=types.Tool(
             name="click_element",
             description="Click on an element using selector",
             inputSchema={
@@ -976,12 +1011,12 @@ def register_interaction_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "selector"]
             }
         ),
-        "handler": click_element
-    }
+        handler=click_element
+    )
     
     # Input text
-    tool_registry["input_text"] = {
-        "definition": types.Tool(
+    tool_registry["input_text"] = ToolEntry(
+        definition=types.Tool(
             name="input_text",
             description="Type text into an input field",
             inputSchema={
@@ -1013,12 +1048,12 @@ def register_interaction_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "selector", "text"]
             }
         ),
-        "handler": input_text
-    }
+        handler=input_text
+    )
     
     # Scroll
-    tool_registry["scroll"] = {
-        "definition": types.Tool(
+    tool_registry["scroll"] = ToolEntry(
+        definition=types.Tool(
             name="scroll",
             description="Scroll the page in specified direction",
             inputSchema={
@@ -1043,12 +1078,12 @@ def register_interaction_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": scroll
-    }
+        handler=scroll
+    )
     
     # Send keys
-    tool_registry["send_keys"] = {
-        "definition": types.Tool(
+    tool_registry["send_keys"] = ToolEntry(
+        definition=types.Tool(
             name="send_keys",
             description="Send keyboard keys (e.g., Tab, Enter, Escape)",
             inputSchema={
@@ -1070,16 +1105,16 @@ def register_interaction_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "keys"]
             }
         ),
-        "handler": send_keys
-    }
+        handler=send_keys
+    )
 
 
-def register_content_tools(tool_registry: Dict[str, Any]):
+def register_content_tools(tool_registry: Dict[str, ToolEntry]):
     """Register content extraction tools."""
     
     # Extract content
-    tool_registry["extract_content"] = {
-        "definition": types.Tool(
+    tool_registry["extract_content"] = ToolEntry(
+        definition=types.Tool(
             name="extract_content",
             description="Extract specific content from the page",
             inputSchema={
@@ -1107,12 +1142,12 @@ def register_content_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "selector"]
             }
         ),
-        "handler": extract_content
-    }
+        handler=extract_content
+    )
     
     # Get page HTML
-    tool_registry["get_page_html"] = {
-        "definition": types.Tool(
+    tool_registry["get_page_html"] = ToolEntry(
+        definition=types.Tool(
             name="get_page_html",
             description="Get the HTML content of the current page",
             inputSchema={
@@ -1135,16 +1170,16 @@ def register_content_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": get_page_html
-    }
+        handler=get_page_html
+    )
 
 
-def register_tab_management_tools(tool_registry: Dict[str, Any]):
+def register_tab_management_tools(tool_registry: Dict[str, ToolEntry]):
     """Register tab management tools."""
     
     # Create new tab
-    tool_registry["create_tab"] = {
-        "definition": types.Tool(
+    tool_registry["create_tab"] = ToolEntry(
+        definition=types.Tool(
             name="create_tab",
             description="Create a new browser tab",
             inputSchema={
@@ -1162,12 +1197,12 @@ def register_tab_management_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": create_tab
-    }
+        handler=create_tab
+    )
     
     # List tabs
-    tool_registry["list_tabs"] = {
-        "definition": types.Tool(
+    tool_registry["list_tabs"] = ToolEntry(
+        definition=types.Tool(
             name="list_tabs",
             description="List all open tabs in the browser session",
             inputSchema={
@@ -1181,12 +1216,12 @@ def register_tab_management_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": list_tabs
-    }
+        handler=list_tabs
+    )
     
     # Switch tab
-    tool_registry["switch_tab"] = {
-        "definition": types.Tool(
+    tool_registry["switch_tab"] = ToolEntry(
+        definition=types.Tool(
             name="switch_tab",
             description="Switch to a specific tab",
             inputSchema={
@@ -1204,12 +1239,12 @@ def register_tab_management_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "tab_index"]
             }
         ),
-        "handler": switch_tab
-    }
+        handler=switch_tab
+    )
     
     # Close tab
-    tool_registry["close_tab"] = {
-        "definition": types.Tool(
+    tool_registry["close_tab"] = ToolEntry(
+        definition=types.Tool(
             name="close_tab",
             description="Close the current tab or a specific tab",
             inputSchema={
@@ -1227,16 +1262,16 @@ def register_tab_management_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": close_tab
-    }
+        handler=close_tab
+    )
 
 
-def register_file_operation_tools(tool_registry: Dict[str, Any]):
+def register_file_operation_tools(tool_registry: Dict[str, ToolEntry]):
     """Register file operation tools."""
     
     # Upload file
-    tool_registry["upload_file"] = {
-        "definition": types.Tool(
+    tool_registry["upload_file"] = ToolEntry(
+        definition=types.Tool(
             name="upload_file",
             description="Upload a file using a file input element",
             inputSchema={
@@ -1258,12 +1293,12 @@ def register_file_operation_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "selector", "file_path"]
             }
         ),
-        "handler": upload_file
-    }
+        handler=upload_file
+    )
     
     # Download file
-    tool_registry["download_file"] = {
-        "definition": types.Tool(
+    tool_registry["download_file"] = ToolEntry(
+        definition=types.Tool(
             name="download_file",
             description="Download a file by clicking a download link",
             inputSchema={
@@ -1285,16 +1320,16 @@ def register_file_operation_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "selector"]
             }
         ),
-        "handler": download_file
-    }
+        handler=download_file
+    )
 
 
-def register_javascript_tools(tool_registry: Dict[str, Any]):
+def register_javascript_tools(tool_registry: Dict[str, ToolEntry]):
     """Register JavaScript execution tools."""
     
     # Execute JavaScript
-    tool_registry["execute_javascript"] = {
-        "definition": types.Tool(
+    tool_registry["execute_javascript"] = ToolEntry(
+        definition=types.Tool(
             name="execute_javascript",
             description="Execute JavaScript code on the page",
             inputSchema={
@@ -1317,16 +1352,16 @@ def register_javascript_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "code"]
             }
         ),
-        "handler": execute_javascript
-    }
+        handler=execute_javascript
+    )
 
 
-def register_waiting_tools(tool_registry: Dict[str, Any]):
+def register_waiting_tools(tool_registry: Dict[str, ToolEntry]):
     """Register waiting tools."""
     
     # Wait for element
-    tool_registry["wait_for_element"] = {
-        "definition": types.Tool(
+    tool_registry["wait_for_element"] = ToolEntry(
+        definition=types.Tool(
             name="wait_for_element",
             description="Wait for an element to appear on the page",
             inputSchema={
@@ -1355,12 +1390,12 @@ def register_waiting_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id", "selector"]
             }
         ),
-        "handler": wait_for_element
-    }
+        handler=wait_for_element
+    )
     
     # Wait for load
-    tool_registry["wait_for_load"] = {
-        "definition": types.Tool(
+    tool_registry["wait_for_load"] = ToolEntry(
+        definition=types.Tool(
             name="wait_for_load",
             description="Wait for page to finish loading",
             inputSchema={
@@ -1385,16 +1420,16 @@ def register_waiting_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": wait_for_load
-    }
+        handler=wait_for_load
+    )
 
 
-def register_visual_tools(tool_registry: Dict[str, Any]):
+def register_visual_tools(tool_registry: Dict[str, ToolEntry]):
     """Register visual tools."""
     
     # Take screenshot (enhanced)
-    tool_registry["take_screenshot"] = {
-        "definition": types.Tool(
+    tool_registry["take_screenshot"] = ToolEntry(
+        definition=types.Tool(
             name="take_screenshot",
             description="Take a screenshot of the page or specific element",
             inputSchema={
@@ -1426,16 +1461,16 @@ def register_visual_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": take_screenshot
-    }
+        handler=take_screenshot
+    )
 
 
-def register_state_management_tools(tool_registry: Dict[str, Any]):
+def register_state_management_tools(tool_registry: Dict[str, ToolEntry]):
     """Register state management tools."""
     
     # Get browser state
-    tool_registry["get_browser_state"] = {
-        "definition": types.Tool(
+    tool_registry["get_browser_state"] = ToolEntry(
+        definition=types.Tool(
             name="get_browser_state",
             description="Get comprehensive browser state information",
             inputSchema={
@@ -1454,12 +1489,12 @@ def register_state_management_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": get_browser_state
-    }
+        handler=get_browser_state
+    )
     
     # Get DOM elements
-    tool_registry["get_dom_elements"] = {
-        "definition": types.Tool(
+    tool_registry["get_dom_elements"] = ToolEntry(
+        definition=types.Tool(
             name="get_dom_elements",
             description="Get clickable and interactive DOM elements",
             inputSchema={
@@ -1483,8 +1518,8 @@ def register_state_management_tools(tool_registry: Dict[str, Any]):
                 "required": ["session_id"]
             }
         ),
-        "handler": get_dom_elements
-    }
+        handler=get_dom_elements
+    )
 
 
 # Tool handler implementations for new tools
@@ -2133,4 +2168,4 @@ if __name__ == "__main__":
     import uvicorn
     PORT = int(os.environ.get("PORT", 3000))
     logger.info(f"Starting Browser-Use MCP server on port {PORT}")
-    uvicorn.run(starlette_app, host="0.0.0.0", port=PORT)
\ No newline at end of file
+    uvicorn.run(starlette_app, host="0.0.0.0", port=PORT, ws="none", access_log=False)
\ No newline at end of file
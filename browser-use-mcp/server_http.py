@@ -5,18 +5,20 @@ Updated to trigger deployment - using JSON-RPC protocol instead of SSE.
 """
 
 import asyncio
+import hmac
 import json
 import logging
 import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import uvicorn
 from mcp.types import Tool, TextContent
 from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.routing import Route
@@ -25,12 +27,12 @@ from starlette.routing import Route
 def load_env_file():
     env_path = Path(__file__).parent.parent / '.env'
     if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+        pairs = (line.strip().partition('=') for line in env_path.read_text().splitlines())
+        os.environ.update({
+            key.strip(): value.strip()
+            for key, sep, value in pairs
+            if sep and key and not key.startswith('#')
+        })
 
 load_env_file()
 
@@ -41,6 +43,11 @@ logger = logging.getLogger(__name__)
 # Environment variables
 MCP_API_KEY = os.environ.get("MCP_API_KEY", "demo-api-key-123")
 PORT = int(os.environ.get("PORT", 3000))
+APP_DEBUG = os.environ.get("APP_DEBUG", "0") == "1"
+
+# Precomputed credentials for constant-time comparison in ApiKeyAuthMiddleware
+BEARER_EXPECTED = f"Bearer {MCP_API_KEY}".encode()
+UNAUTHORIZED_RESPONSE = JSONResponse({"error": "Unauthorized"}, status_code=401)
 
 # Global session storage
 sessions = {}
@@ -48,18 +55,37 @@ sessions = {}
 # Tool registry
 tool_registry = {}
 
-class ApiKeyAuthMiddleware(BaseHTTPMiddleware):
-    """API Key authentication middleware."""
+# tools/list entries, filled in by setup_tools()
+tools_list = []
+
+def get_header(scope, name: bytes) -> Optional[bytes]:
+    """Return the first raw value of a lowercase header from an ASGI scope."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+class ApiKeyAuthMiddleware:
+    """API Key authentication middleware.
     
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in ["/health"]:
-            return await call_next(request)
+    Plain ASGI rather than BaseHTTPMiddleware, so exempt paths such as
+    /health pass straight through without building a Request.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
         
-        auth = request.headers.get("authorization")
-        if auth and auth == f"Bearer {MCP_API_KEY}":
-            return await call_next(request)
+        auth = get_header(scope, b"authorization")
+        if auth and hmac.compare_digest(auth, BEARER_EXPECTED):
+            await self.app(scope, receive, send)
+            return
         
-        return JSONResponse({"error": "Unauthorized"}, status_code=401)
+        await UNAUTHORIZED_RESPONSE(scope, receive, send)
 
 def setup_tools():
     """Setup all browser automation tools."""
@@ -195,6 +221,16 @@ def setup_tools():
         ),
         "handler": list_browser_sessions
     }
+    
+    # The registry is fixed from here on, so build the tools/list payload once
+    tools_list[:] = [
+        {
+            "name": tool_data["definition"].name,
+            "description": tool_data["definition"].description,
+            "inputSchema": tool_data["definition"].inputSchema
+        }
+        for tool_data in tool_registry.values()
+    ]
 
 async def handle_mcp_request(request: Request) -> JSONResponse:
     """Handle MCP JSON-RPC requests."""
@@ -224,26 +260,11 @@ async def handle_mcp_request(request: Request) -> JSONResponse:
             return JSONResponse({"jsonrpc": "2.0", "id": request_id, "result": {}})
         
         elif method == 'tools/list':
-            logger.info(f"Tools registry has {len(tool_registry)} tools")
-            tools = []
-            for name, tool_data in tool_registry.items():
-                try:
-                    tool_def = tool_data["definition"]
-                    tool_dict = {
-                        "name": tool_def.name,
-                        "description": tool_def.description,
-                        "inputSchema": tool_def.inputSchema
-                    }
-                    tools.append(tool_dict)
-                    logger.info(f"Added tool: {name}")
-                except Exception as e:
-                    logger.error(f"Error processing tool {name}: {e}")
-            
             return JSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
-                    "tools": tools
+                    "tools": tools_list
                 }
             })
         
@@ -280,7 +301,7 @@ async def handle_mcp_request(request: Request) -> JSONResponse:
                 })
                 
             except Exception as e:
-                logger.error(f"Error executing tool {tool_name}: {e}")
+                logger.error("Error executing tool %s: %s", tool_name, e)
                 return JSONResponse({
                     "jsonrpc": "2.0",
                     "id": request_id,
@@ -301,7 +322,7 @@ async def handle_mcp_request(request: Request) -> JSONResponse:
             })
     
     except Exception as e:
-        logger.error(f"Error handling MCP request: {e}")
+        logger.error("Error handling MCP request: %s", e)
         return JSONResponse({
             "jsonrpc": "2.0",
             "id": None,
@@ -311,6 +332,18 @@ async def handle_mcp_request(request: Request) -> JSONResponse:
             }
         }, status_code=400)
 
+_last_ts = float("-inf")
+_last_iso = ""
+
+def _now_iso() -> str:
+    """Return the current local time in ISO format, cached for up to one second."""
+    global _last_ts, _last_iso
+    now = time.monotonic()
+    if now - _last_ts > 1.0:
+        _last_iso = datetime.now().isoformat()
+        _last_ts = now
+    return _last_iso
+
 async def health_check(request: Request) -> JSONResponse:
     """Health check endpoint."""
     return JSONResponse({
@@ -318,7 +351,7 @@ async def health_check(request: Request) -> JSONResponse:
         "service": "browser-use-mcp-server",
         "active_sessions": len(sessions),
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     })
 
 # Tool implementations
@@ -477,7 +510,7 @@ def create_app():
     
     # Create Starlette app
     app = Starlette(
-        debug=True,
+        debug=APP_DEBUG,
         routes=[
             Route("/health", endpoint=health_check, methods=["GET"]),
             Route("/mcp", endpoint=handle_mcp_request, methods=["POST"])
@@ -488,7 +521,8 @@ def create_app():
                 "allow_origins": ["*"],
                 "allow_methods": ["*"], 
                 "allow_headers": ["*"],
-            })
+            }),
+            (GZipMiddleware, [], {"minimum_size": 512})
         ]
     )
     
@@ -499,4 +533,4 @@ app = create_app()
 
 if __name__ == "__main__":
     logger.info(f"Starting Browser-Use MCP HTTP server on port {PORT}")
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=PORT, ws="none", access_log=False)
\ No newline at end of file
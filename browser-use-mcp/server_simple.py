@@ -8,21 +8,22 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import asyncio
+import hmac
 import json
 import logging
 import os
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+import anyio
 import mcp.types as types
 from mcp.server.lowlevel import Server
 from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.routing import Route
 from starlette.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.requests import Request
+from starlette.datastructures import QueryParams
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,27 +32,230 @@ logger = logging.getLogger(__name__)
 # Environment variables
 API_KEY = os.environ.get("API_KEY", "demo-api-key-123")
 PORT = int(os.environ.get("PORT", 3000))
+APP_DEBUG = os.environ.get("APP_DEBUG", "0") == "1"
+# Window for merging SSE body chunks into one socket write; 0 disables it
+SSE_BATCH_MS = float(os.environ.get("SSE_BATCH_MS", 2))
+
+# Precomputed credentials for constant-time comparison in ApiKeyAuthMiddleware
+BEARER_EXPECTED = f"Bearer {API_KEY}".encode()
+API_KEY_BYTES = API_KEY.encode()
+UNAUTHORIZED_RESPONSE = JSONResponse({"detail": "Unauthorized"}, status_code=401)
 
 # Global session storage
 sessions = {}
 
 
-class ApiKeyAuthMiddleware(BaseHTTPMiddleware):
-    """API Key authentication middleware."""
+def get_header(scope, name: bytes) -> Optional[bytes]:
+    """Return the first raw value of a lowercase header from an ASGI scope."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+class ApiKeyAuthMiddleware:
+    """API Key authentication middleware.
     
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in ["/health"]:
-            return await call_next(request)
+    Plain ASGI rather than BaseHTTPMiddleware, so exempt paths such as
+    /health pass straight through without building a Request.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
         
-        auth = request.headers.get("authorization")
-        if auth and auth == f"Bearer {API_KEY}":
-            return await call_next(request)
+        # Check the header first, then fall back to the api_key query param;
+        # proxies may add an Authorization header of their own
+        auth = get_header(scope, b"authorization")
+        if auth is not None and hmac.compare_digest(auth, BEARER_EXPECTED):
+            await self.app(scope, receive, send)
+            return
         
-        api_key = request.query_params.get("api_key")
-        if api_key and api_key == API_KEY:
-            return await call_next(request)
+        api_key = QueryParams(scope["query_string"]).get("api_key")
+        if api_key and hmac.compare_digest(api_key.encode(), API_KEY_BYTES):
+            await self.app(scope, receive, send)
+            return
         
-        return JSONResponse({"detail": "Unauthorized"}, status_code=401)
+        await UNAUTHORIZED_RESPONSE(scope, receive, send)
+
+
+# Tool definitions are static, so build them once at import time
+TOOLS = [
+    types.Tool(
+        name="create_browser_session",
+        description="Create a new browser session",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Unique identifier for the session"
+                },
+                "headless": {
+                    "type": "boolean",
+                    "description": "Run browser in headless mode",
+                    "default": True
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    types.Tool(
+        name="navigate_to_url",
+        description="Navigate to a URL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID"
+                },
+                "url": {
+                    "type": "string",
+                    "description": "URL to navigate to"
+                }
+            },
+            "required": ["session_id", "url"]
+        }
+    ),
+    types.Tool(
+        name="get_page_content",
+        description="Get the current page content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID"
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    types.Tool(
+        name="execute_task",
+        description="Execute a task using AI agent",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID"
+                },
+                "task": {
+                    "type": "string",
+                    "description": "Task description"
+                },
+                "provider": {
+                    "type": "string",
+                    "enum": ["openai", "anthropic"],
+                    "description": "LLM provider",
+                    "default": "openai"
+                }
+            },
+            "required": ["session_id", "task"]
+        }
+    ),
+    types.Tool(
+        name="close_session",
+        description="Close a browser session",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Session ID to close"
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    types.Tool(
+        name="list_sessions",
+        description="List all active sessions",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    )
+]
+
+
+def add_response_header(send, name: bytes, value: bytes):
+    """Wrap an ASGI send callable to append a header to the response start."""
+    async def wrapped(message):
+        if message["type"] == "http.response.start":
+            message = {**message, "headers": [*message.get("headers", []), (name, value)]}
+        await send(message)
+    return wrapped
+
+
+class CoalescingSend:
+    """ASGI send wrapper that merges streamed body chunks sent close together.
+    
+    Chunks with ``more_body=True`` are buffered and written in one message
+    once ``window`` seconds have passed since the first of them. Any other
+    message flushes the buffer first, so ordering is preserved. If a timed
+    flush fails (the client went away), the error is re-raised from the
+    next call so the producer stops instead of buffering forever.
+    """
+    
+    def __init__(self, send, window: float):
+        self._send = send
+        self._window = window
+        self._buffer = bytearray()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._error: Optional[BaseException] = None
+    
+    async def __call__(self, message):
+        self._raise_pending()
+        if message["type"] == "http.response.body" and message.get("more_body", False):
+            self._buffer += message.get("body", b"")
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_later())
+            return
+        await self.flush()
+        async with self._lock:
+            await self._send(message)
+    
+    async def _flush_later(self):
+        await asyncio.sleep(self._window)
+        self._flush_task = None
+        try:
+            await self._write()
+        except Exception as e:
+            self._error = e
+    
+    def _raise_pending(self):
+        if self._error is not None:
+            raise self._error
+    
+    async def flush(self):
+        """Cancel the pending timer and write out anything buffered."""
+        self._raise_pending()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._write()
+    
+    def close(self):
+        """Drop the pending flush when the connection is gone."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+    
+    async def _write(self):
+        async with self._lock:
+            if not self._buffer:
+                return
+            body = bytes(self._buffer)
+            self._buffer.clear()
+            await self._send({"type": "http.response.body", "body": body, "more_body": True})
 
 
 def create_app():
@@ -63,105 +267,7 @@ def create_app():
     # Register tools
     @server.list_tools()
     async def list_tools() -> list[types.Tool]:
-        return [
-            types.Tool(
-                name="create_browser_session",
-                description="Create a new browser session",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Unique identifier for the session"
-                        },
-                        "headless": {
-                            "type": "boolean",
-                            "description": "Run browser in headless mode",
-                            "default": True
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            types.Tool(
-                name="navigate_to_url",
-                description="Navigate to a URL",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID"
-                        },
-                        "url": {
-                            "type": "string",
-                            "description": "URL to navigate to"
-                        }
-                    },
-                    "required": ["session_id", "url"]
-                }
-            ),
-            types.Tool(
-                name="get_page_content",
-                description="Get the current page content",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID"
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            types.Tool(
-                name="execute_task",
-                description="Execute a task using AI agent",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID"
-                        },
-                        "task": {
-                            "type": "string",
-                            "description": "Task description"
-                        },
-                        "provider": {
-                            "type": "string",
-                            "enum": ["openai", "anthropic"],
-                            "description": "LLM provider",
-                            "default": "openai"
-                        }
-                    },
-                    "required": ["session_id", "task"]
-                }
-            ),
-            types.Tool(
-                name="close_session",
-                description="Close a browser session",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Session ID to close"
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            types.Tool(
-                name="list_sessions",
-                description="List all active sessions",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
-            )
-        ]
+        return TOOLS
     
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
@@ -193,16 +299,26 @@ def create_app():
     # SSE handler
     async def handle_sse(request):
         logger.info(f"New SSE connection from {request.client.host}")
+        # Tell nginx-style proxies not to buffer the event stream
+        send = add_response_header(request._send, b"x-accel-buffering", b"no")
+        if SSE_BATCH_MS > 0:
+            send = CoalescingSend(send, SSE_BATCH_MS / 1000)
         try:
             async with sse.connect_sse(
-                request.scope, request.receive, request._send
+                request.scope, request.receive, send
             ) as streams:
                 await server.run(
                     streams[0], streams[1], server.create_initialization_options()
                 )
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            # The client went away mid-stream; that's a normal shutdown
+            logger.info("SSE connection closed by client")
         except Exception as e:
-            logger.error(f"SSE error: {e}")
+            logger.exception("SSE error: %s", e)
             raise
+        finally:
+            if isinstance(send, CoalescingSend):
+                send.close()
     
     # Health check endpoint
     async def health_check(request):
@@ -215,7 +331,7 @@ def create_app():
     
     # Create Starlette app
     starlette_app = Starlette(
-        debug=True,
+        debug=APP_DEBUG,
         routes=[
             Route("/sse", endpoint=handle_sse),
             Route("/health", endpoint=health_check),
@@ -444,4 +560,4 @@ starlette_app = create_app()
 if __name__ == "__main__":
     import uvicorn
     logger.info(f"Starting Browser-Use MCP server on port {PORT}")
-    uvicorn.run(starlette_app, host="0.0.0.0", port=PORT)
\ No newline at end of file
+    uvicorn.run(starlette_app, host="0.0.0.0", port=PORT, ws="none", access_log=False)
\ No newline at end of file
@@ -31,6 +31,113 @@ API_KEY = os.environ.get("API_KEY", "demo-api-key-123")
 sessions = {}
 
 
+# Tool definitions are static, so build them once at import time
+TOOLS = [
+    types.Tool(
+        name="create_browser_session",
+        description="Create a new browser session for web automation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Unique identifier for the session"
+                },
+                "headless": {
+                    "type": "boolean",
+                    "description": "Run browser in headless mode",
+                    "default": True
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    types.Tool(
+        name="navigate_to_url",
+        description="Navigate to a specific URL in the browser",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Browser session ID"
+                },
+                "url": {
+                    "type": "string",
+                    "description": "URL to navigate to"
+                }
+            },
+            "required": ["session_id", "url"]
+        }
+    ),
+    types.Tool(
+        name="get_page_content",
+        description="Extract content from the current page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Browser session ID"
+                },
+                "include_html": {
+                    "type": "boolean",
+                    "description": "Include HTML in the response",
+                    "default": False
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    types.Tool(
+        name="execute_browser_task",
+        description="Execute a complex browser task using AI agent",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Browser session ID"
+                },
+                "task": {
+                    "type": "string",
+                    "description": "Natural language description of the task to perform"
+                },
+                "provider": {
+                    "type": "string",
+                    "enum": ["openai", "anthropic"],
+                    "description": "LLM provider to use for the AI agent",
+                    "default": "openai"
+                }
+            },
+            "required": ["session_id", "task"]
+        }
+    ),
+    types.Tool(
+        name="close_browser_session",
+        description="Close a browser session and cleanup resources",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "Browser session ID to close"
+                }
+            },
+            "required": ["session_id"]
+        }
+    ),
+    types.Tool(
+        name="list_browser_sessions",
+        description="List all active browser sessions",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    )
+]
+
+
 def create_server():
     """Create the MCP server."""
     
@@ -39,110 +146,7 @@ def create_server():
     # Register tools
     @server.list_tools()
     async def list_tools() -> list[types.Tool]:
-        return [
-            types.Tool(
-                name="create_browser_session",
-                description="Create a new browser session for web automation",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Unique identifier for the session"
-                        },
-                        "headless": {
-                            "type": "boolean",
-                            "description": "Run browser in headless mode",
-                            "default": True
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            types.Tool(
-                name="navigate_to_url",
-                description="Navigate to a specific URL in the browser",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Browser session ID"
-                        },
-                        "url": {
-                            "type": "string",
-                            "description": "URL to navigate to"
-                        }
-                    },
-                    "required": ["session_id", "url"]
-                }
-            ),
-            types.Tool(
-                name="get_page_content",
-                description="Extract content from the current page",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Browser session ID"
-                        },
-                        "include_html": {
-                            "type": "boolean",
-                            "description": "Include HTML in the response",
-                            "default": False
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            types.Tool(
-                name="execute_browser_task",
-                description="Execute a complex browser task using AI agent",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Browser session ID"
-                        },
-                        "task": {
-                            "type": "string",
-                            "description": "Natural language description of the task to perform"
-                        },
-                        "provider": {
-                            "type": "string",
-                            "enum": ["openai", "anthropic"],
-                            "description": "LLM provider to use for the AI agent",
-                            "default": "openai"
-                        }
-                    },
-                    "required": ["session_id", "task"]
-                }
-            ),
-            types.Tool(
-                name="close_browser_session",
-                description="Close a browser session and cleanup resources",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "session_id": {
-                            "type": "string",
-                            "description": "Browser session ID to close"
-                        }
-                    },
-                    "required": ["session_id"]
-                }
-            ),
-            types.Tool(
-                name="list_browser_sessions",
-                description="List all active browser sessions",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
-            )
-        ]
+        return TOOLS
     
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
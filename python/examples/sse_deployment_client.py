@@ -5,10 +5,13 @@ Demonstrates how to use the SSE deployment monitoring tools.
 """
 
 import json
+import re
 import requests
 import time
 from typing import Dict, Any
 
+_UUID_RE = re.compile(r'Deployment UUID:\s*(\S+)')
+
 class SSEDeploymentClient:
     """Client for interacting with SSE deployment monitoring."""
     
@@ -56,6 +59,16 @@ class SSEDeploymentClient:
         response.raise_for_status()
         return response.json()
     
+    def wait_for_deployment(self, deployment_uuid: str, delays=(0.05, 0.1, 0.2, 0.4)) -> bool:
+        """Poll until the server is monitoring the deployment, backing off between tries."""
+        for delay in delays:
+            status_result = self.get_deployment_status(deployment_uuid)
+            content = status_result.get('result', {}).get('content') or [{}]
+            if 'not found' not in content[0].get('text', ''):
+                return True
+            time.sleep(delay)
+        return False
+    
     def list_active_deployments(self) -> Dict[str, Any]:
         """List all active deployments."""
         payload = {
@@ -111,34 +124,43 @@ class SSEDeploymentClient:
     
     def _handle_sse_event(self, data: Dict[str, Any]):
         """Handle SSE event data."""
-        event_type = data.get('type', 'unknown')
-        timestamp = data.get('timestamp', '')
-        
-        if event_type == 'status':
-            status = data.get('status', 'unknown')
-            print(f"📊 [{timestamp}] Initial Status: {status}")
-            
-        elif event_type == 'progress':
-            status = data.get('status', 'unknown')
-            details = data.get('details', {})
-            print(f"⏳ [{timestamp}] Progress: {status}")
-            if details:
-                print(f"   Details: {details}")
-                
-        elif event_type == 'completed':
-            success = data.get('success', False)
-            status_icon = "✅" if success else "❌"
-            print(f"{status_icon} [{timestamp}] Deployment completed: {'SUCCESS' if success else 'FAILED'}")
-            
-        elif event_type == 'heartbeat':
-            print(f"💓 [{timestamp}] Heartbeat")
-            
-        elif event_type == 'error':
-            message = data.get('message', 'Unknown error')
-            print(f"❌ Error: {message}")
-            
-        else:
-            print(f"🔍 [{timestamp}] {event_type}: {data}")
+        handler = _SSE_HANDLERS.get(data.get('type', 'unknown'), _h_default)
+        handler(data)
+
+def _h_status(data: Dict[str, Any]):
+    status = data.get('status', 'unknown')
+    print(f"📊 [{data.get('timestamp', '')}] Initial Status: {status}")
+
+def _h_progress(data: Dict[str, Any]):
+    status = data.get('status', 'unknown')
+    details = data.get('details', {})
+    print(f"⏳ [{data.get('timestamp', '')}] Progress: {status}")
+    if details:
+        print(f"   Details: {details}")
+
+def _h_completed(data: Dict[str, Any]):
+    success = data.get('success', False)
+    status_icon = "✅" if success else "❌"
+    print(f"{status_icon} [{data.get('timestamp', '')}] Deployment completed: {'SUCCESS' if success else 'FAILED'}")
+
+def _h_heartbeat(data: Dict[str, Any]):
+    print(f"💓 [{data.get('timestamp', '')}] Heartbeat")
+
+def _h_error(data: Dict[str, Any]):
+    message = data.get('message', 'Unknown error')
+    print(f"❌ Error: {message}")
+
+def _h_default(data: Dict[str, Any]):
+    print(f"🔍 [{data.get('timestamp', '')}] {data.get('type', 'unknown')}: {data}")
+
+# Event type -> printer, looked up once per SSE event
+_SSE_HANDLERS = {
+    'status': _h_status,
+    'progress': _h_progress,
+    'completed': _h_completed,
+    'heartbeat': _h_heartbeat,
+    'error': _h_error,
+}
 
 def main():
     """Example usage of SSE deployment monitoring."""
@@ -167,13 +189,10 @@ def main():
         
         # Extract deployment UUID from result
         content = deploy_result.get('result', {}).get('content', [{}])[0].get('text', '')
-        deployment_uuid = None
         
         # Parse deployment UUID from response text
-        for line in content.split('\n'):
-            if 'Deployment UUID:' in line:
-                deployment_uuid = line.split('Deployment UUID:')[1].strip()
-                break
+        match = _UUID_RE.search(content)
+        deployment_uuid = match.group(1) if match else None
         
         if not deployment_uuid:
             print("❌ Could not extract deployment UUID from response")
@@ -185,7 +204,8 @@ def main():
         
         # 3. Stream real-time updates
         print("3. Streaming real-time deployment updates...")
-        time.sleep(2)  # Brief pause before streaming
+        if not client.wait_for_deployment(deployment_uuid):
+            print("⚠️  Deployment not registered yet, streaming anyway")
         client.stream_deployment_updates(deployment_uuid)
         
         print("\n" + "=" * 50)
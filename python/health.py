@@ -3,28 +3,45 @@ Health check endpoint for MCP server.
 """
 
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse
 from starlette.routing import Route
 import json
+import time
 from datetime import datetime
 
+from utils.responses import ORJSONResponse
+
+# Probes hit these endpoints every few seconds; one-second timestamp
+# resolution is plenty, so reuse the formatted string within that window.
+_last_ts = float("-inf")
+_last_iso = ""
+
+
+def _now_iso() -> str:
+    """Return the current UTC time in ISO format, cached for up to one second."""
+    global _last_ts, _last_iso
+    now = time.monotonic()
+    if now - _last_ts > 1.0:
+        _last_iso = datetime.utcnow().isoformat()
+        _last_ts = now
+    return _last_iso
+
 
 async def health_check(request):
     """Health check endpoint."""
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso(),
         "service": "mcp-python-server"
     })
 
 
 async def metrics(request):
     """Basic metrics endpoint."""
-    return JSONResponse({
+    return ORJSONResponse({
         "uptime": "unknown",  # Could implement actual uptime tracking
         "requests_total": 0,  # Could implement request counting
         "errors_total": 0,    # Could implement error counting
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso()
     })
 
 
@@ -6,20 +6,27 @@ Updated: Testing REMOTE SSE deployment monitoring - 2025-08-06
 """
 
 import asyncio
+import functools
+import hmac
 import json
 import logging
 import os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
+import orjson
 import uvicorn
 from mcp.server.lowlevel import Server
 from mcp.server.sse import SseServerTransport
 from mcp.types import Tool, TextContent
 from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request  
-from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.responses import Response, StreamingResponse
 from starlette.routing import Route
 
 from tools.math_tools import register_math_tools
@@ -28,215 +35,417 @@ from tools.crawl4ai_tools import register_crawl4ai_tools
 from tools.coolify_tools import register_coolify_tools
 from tools.help_tools import register_help_tools
 from tools.coolify_tools.sse_deployment_monitor import deployment_monitor
+from tools.coolify_tools.base import close_coolify_session
 from utils.logger import setup_logger
+from utils.env import load_env_file
+from utils.http import close_http_session
+from utils.responses import ORJSONResponse
+
+try:
+    import uvloop  # noqa: F401
+    _EVENT_LOOP = "uvloop"
+except ImportError:  # uvloop is unavailable on Windows
+    _EVENT_LOOP = "asyncio"
 
 # Load environment variables from .env file
-def load_env_file():
-    env_path = Path(__file__).parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
-
-load_env_file()
+load_env_file(Path(__file__).parent.parent / '.env')
+
+@dataclass(frozen=True)
+class Config:
+    """Server settings read once from the environment at import time."""
+    host: str
+    port: int
+    log_level: str
+    workers: int
+    backlog: int
+    timeout_keep_alive: int
+    limit_concurrency: int
+    allowed_origins: frozenset
+
+CONFIG = Config(
+    host=os.getenv("HOST", "0.0.0.0"),
+    port=int(os.getenv("PORT", "3009")),
+    log_level=os.getenv("LOG_LEVEL", "INFO").lower(),
+    workers=int(os.getenv("WORKERS", "1")),
+    backlog=int(os.getenv("BACKLOG", "2048")),
+    timeout_keep_alive=int(os.getenv("KEEPALIVE_TIMEOUT", "75")),
+    limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", "2000")),
+    allowed_origins=frozenset((os.getenv("ALLOWED_ORIGINS") or "*").split(",")),
+)
+
+# Bearer token expected on /mcp and the SSE endpoint, compared in constant time
+EXPECTED_TOKEN = os.getenv('MCP_API_KEY', 'demo-api-key-123').encode()
 
 # Set up logging
 logger = setup_logger("simple_http_server", logging.INFO)
 
 # Global tool registry
 tool_registry = {}
+_tools_ready = False
+# Serialized tools/list payload and Tool list, built once by setup_tools()
+_tools_list_json = b"[]"
+_tool_definitions: List[Tool] = []
 
 def setup_tools():
-    """Setup all MCP tools."""
+    """Setup all MCP tools.
+
+    Safe to call more than once: registration only runs on the first call,
+    so ``create_app()`` and ``create_mcp_server()`` can both request it.
+    """
+    global _tools_ready, _tools_list_json, _tool_definitions
+    if _tools_ready:
+        return
     register_math_tools(tool_registry)
     register_text_tools(tool_registry)
     register_crawl4ai_tools(tool_registry)
     register_coolify_tools(tool_registry)
     register_help_tools(tool_registry)
+    
+    # Handlers return a stable shape, so choose each result converter once
+    for tool_data in tool_registry.values():
+        tool_data["to_contents"] = _converter_for(tool_data["handler"])
+    
+    # Tool metadata never changes after registration, so serialize it once
+    _tool_definitions = [tool_data["definition"] for tool_data in tool_registry.values()]
+    _tools_list_json = orjson.dumps([
+        {
+            "name": tool_def.name,
+            "description": tool_def.description,
+            "inputSchema": tool_def.inputSchema
+        }
+        for tool_def in _tool_definitions
+    ])
+    _tools_ready = True
 
-async def handle_mcp_request(request: Request) -> JSONResponse:
-    """Handle MCP JSON-RPC requests."""
-    try:
-        logger.info(f"Received MCP request: {request.method} {request.url}")
+# Envelope start shared by the hand-assembled responses below
+_RESPONSE_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+def _ok(request_id: Any, result: Any) -> Response:
+    """Build a JSON-RPC success response."""
+    return Response(
+        orjson.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}),
+        media_type="application/json",
+    )
+
+def _err(request_id: Any, code: int, message: str, status_code: int = 200) -> Response:
+    """Build a JSON-RPC error response."""
+    return Response(
+        orjson.dumps({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+# Auth failures are static, so build their responses once
+_MISSING_AUTH_RESPONSE = _err(None, -32001, "Missing or invalid Authorization header", status_code=401)
+_INVALID_KEY_RESPONSE = _err(None, -32001, "Invalid API key", status_code=401)
+_SSE_MISSING_AUTH_RESPONSE = ORJSONResponse({"error": "Missing Authorization header"}, status_code=401)
+_SSE_INVALID_KEY_RESPONSE = ORJSONResponse({"error": "Invalid API key"}, status_code=401)
+
+def _to_contents(result: Any) -> List[TextContent]:
+    """Normalize an arbitrary tool result to a list of TextContent."""
+    if isinstance(result, TextContent):
+        return [result]
+    if isinstance(result, list):
+        contents = []
+        for item in result:
+            if isinstance(item, TextContent):
+                contents.append(item)
+            elif hasattr(item, 'type') and hasattr(item, 'text'):
+                contents.append(TextContent(type=item.type, text=item.text))
+            else:
+                contents.append(TextContent(type="text", text=str(item)))
+        return contents
+    return [TextContent(type="text", text=str(result))]
+
+def _passthrough_contents(result: Any) -> List[TextContent]:
+    """Converter for handlers annotated to return ``list[TextContent]``.
+    
+    Annotations are not enforced, so anything other than a list of
+    TextContent still goes through the generic converter.
+    """
+    if isinstance(result, list) and all(isinstance(item, TextContent) for item in result):
+        return result
+    return _to_contents(result)
+
+_TEXT_CONTENT_LIST_TYPES = (list[TextContent], List[TextContent])
+
+def _converter_for(handler) -> Callable[[Any], List[TextContent]]:
+    """Pick a result converter for a tool handler from its return annotation."""
+    return_type = getattr(handler, '__annotations__', {}).get('return')
+    if return_type in _TEXT_CONTENT_LIST_TYPES:
+        return _passthrough_contents
+    return _to_contents
+
+# Results of tools registered with "cacheable": True, most recent last
+RESULT_CACHE_SIZE = 1024
+# Calls whose encoded arguments are larger than this are not cached, so the
+# text tools cannot fill the cache with arbitrarily large inputs and outputs
+RESULT_CACHE_MAX_ARGS_BYTES = 4096
+_result_cache: "OrderedDict[tuple, List[TextContent]]" = OrderedDict()
+
+async def _call_tool(name: str, arguments: dict) -> List[TextContent]:
+    """Run a registered tool and normalize its result to a list of TextContent.
+
+    Shared by the HTTP JSON-RPC endpoint and the MCP server so both
+    transports dispatch tools the same way.
+    """
+    tool_data = tool_registry[name]
+    if not tool_data.get("cacheable"):
+        return tool_data["to_contents"](await tool_data["handler"](**arguments))
+    
+    # Pure tools give the same answer for the same arguments, so serve
+    # repeats from an LRU keyed on the canonical argument encoding
+    encoded = orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+    if len(encoded) > RESULT_CACHE_MAX_ARGS_BYTES:
+        return tool_data["to_contents"](await tool_data["handler"](**arguments))
+    key = (name, encoded)
+    contents = _result_cache.get(key)
+    if contents is not None:
+        _result_cache.move_to_end(key)
+        return contents
+    
+    contents = tool_data["to_contents"](await tool_data["handler"](**arguments))
+    _result_cache[key] = contents
+    if len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    return contents
+
+@functools.lru_cache(maxsize=256)
+def _notification_ack(encoded_id: bytes) -> Response:
+    """Return a cached empty-result response for a notification.
+
+    Notifications are fire-and-forget, so the body only ever varies by id.
+    Keyed on the encoded id so unhashable ids cannot break the cache.
+    """
+    return Response(
+        _RESPONSE_PREFIX + encoded_id + b',"result":{}}',
+        media_type="application/json",
+    )
+
+class AuthMiddleware:
+    """Reject requests without a valid Bearer token before routing.
+
+    Guards /mcp and the SSE endpoint. Runs on the raw ASGI scope so
+    unauthenticated traffic never gets a Request object or a body read.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
         
-        # Check authorization header
-        auth_header = request.headers.get('authorization')
-        expected_key = os.getenv('MCP_API_KEY', 'demo-api-key-123')
+        path = scope["path"]
+        is_sse = path.startswith("/sse/")
+        if not (is_sse or path.startswith("/mcp")):
+            await self.app(scope, receive, send)
+            return
         
-        if not auth_header or not auth_header.startswith('Bearer '):
-            logger.warning("Missing or invalid Authorization header")
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {"code": -32001, "message": "Missing or invalid Authorization header"}
-            }, status_code=401)
+        auth_header = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+                break
         
-        token = auth_header[7:]  # Remove 'Bearer ' prefix
-        if token != expected_key:
+        if not auth_header or not auth_header.startswith(b"Bearer "):
+            logger.warning("Missing or invalid Authorization header")
+            response = _SSE_MISSING_AUTH_RESPONSE if is_sse else _MISSING_AUTH_RESPONSE
+        elif not hmac.compare_digest(auth_header[7:], EXPECTED_TOKEN):
             logger.warning("Invalid API key")
-            return JSONResponse({
-                "jsonrpc": "2.0", 
-                "id": None,
-                "error": {"code": -32001, "message": "Invalid API key"}
-            }, status_code=401)
-        
-        data = await request.json()
-        logger.info(f"Request data: {data}")
-        method = data.get('method')
-        params = data.get('params', {})
-        request_id = data.get('id')
+            response = _SSE_INVALID_KEY_RESPONSE if is_sse else _INVALID_KEY_RESPONSE
+        else:
+            await self.app(scope, receive, send)
+            return
         
-        if method == 'initialize':
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {}
-                    },
-                    "serverInfo": {
-                        "name": "python-mcp-tools",
-                        "version": "1.0.0"
-                    }
-                }
-            })
+        await response(scope, receive, send)
+
+# initialize only varies by id, so the rest of the response is serialized once
+_INIT_SUFFIX = b',"result":' + orjson.dumps({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {}
+    },
+    "serverInfo": {
+        "name": "python-mcp-tools",
+        "version": "1.0.0"
+    }
+}) + b'}'
+
+async def _handle_initialize(request_id: Any, params: Dict[str, Any], method: str) -> Response:
+    return Response(
+        _RESPONSE_PREFIX + orjson.dumps(request_id) + _INIT_SUFFIX,
+        media_type="application/json",
+    )
+
+async def _handle_tools_list(request_id: Any, params: Dict[str, Any], method: str) -> Response:
+    return Response(
+        _RESPONSE_PREFIX + orjson.dumps(request_id)
+        + b',"result":{"tools":' + _tools_list_json + b'}}',
+        media_type="application/json",
+    )
+
+async def _handle_tools_call(request_id: Any, params: Dict[str, Any], method: str) -> Response:
+    tool_name = params.get('name')
+    arguments = params.get('arguments', {})
+    
+    if tool_name not in tool_registry:
+        return _err(request_id, -32601, f"Unknown tool: {tool_name}")
+    
+    try:
+        contents = await _call_tool(tool_name, arguments)
+        logger.info("Successfully executed tool: %s", tool_name)
+        result = [{"type": c.type, "text": c.text} for c in contents]
         
-        elif method == 'notifications/initialized':
-            return JSONResponse({"jsonrpc": "2.0", "id": request_id, "result": {}})
+        return _ok(request_id, {"content": result})
         
-        elif method == 'tools/list':
-            logger.info(f"Tools registry has {len(tool_registry)} tools")
-            tools = []
-            for name, tool_data in tool_registry.items():
-                try:
-                    tool_def = tool_data["definition"]
-                    # Convert Tool object to dict for JSON serialization
-                    tool_dict = {
-                        "name": tool_def.name,
-                        "description": tool_def.description,
-                        "inputSchema": tool_def.inputSchema
-                    }
-                    tools.append(tool_dict)
-                    logger.info(f"Added tool: {name}")
-                except Exception as e:
-                    logger.error(f"Error processing tool {name}: {e}")
-            
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {"tools": tools}
-            })
+    except Exception as e:
+        logger.error("Error executing tool %s: %s", tool_name, e)
+        return _err(request_id, -32603, f"Tool execution error: {str(e)}")
+
+async def _handle_unknown(request_id: Any, params: Dict[str, Any], method: str) -> Response:
+    return _err(request_id, -32601, f"Unknown method: {method}")
+
+# JSON-RPC method -> handler; notifications/* are matched by prefix
+METHOD_HANDLERS = {
+    'initialize': _handle_initialize,
+    'tools/list': _handle_tools_list,
+    'tools/call': _handle_tools_call,
+}
+
+async def _dispatch(data: Any) -> Response:
+    """Route a single JSON-RPC request object to its method handler.
+    
+    Malformed objects get their own -32600 reply, so one bad item cannot
+    fail the rest of a batch.
+    """
+    if not isinstance(data, dict):
+        return _err(None, -32600, "Invalid Request")
+    method = data.get('method')
+    params = data.get('params', {})
+    request_id = data.get('id')
+    if not isinstance(method, str) or not isinstance(params, dict):
+        return _err(request_id, -32600, "Invalid Request")
+    
+    handler = METHOD_HANDLERS.get(method)
+    if handler is None:
+        if method.startswith('notifications/'):
+            return _notification_ack(orjson.dumps(request_id))
+        handler = _handle_unknown
+    return await handler(request_id, params, method)
+
+async def _dispatch_batch(batch: List[Any]) -> Response:
+    """Handle a JSON-RPC batch, running its calls concurrently.
+    
+    Items without an ``id`` are notifications and get no entry in the
+    reply, as the JSON-RPC 2.0 spec requires.
+    """
+    if not batch:
+        return _err(None, -32600, "Invalid Request")
+    
+    responses = await asyncio.gather(*[_dispatch(item) for item in batch])
+    bodies = [
+        response.body
+        for item, response in zip(batch, responses)
+        if not isinstance(item, dict) or 'id' in item
+    ]
+    if not bodies:
+        return Response(status_code=204)
+    return Response(b"[" + b",".join(bodies) + b"]", media_type="application/json")
+
+async def handle_mcp_request(request: Request) -> Response:
+    """Handle MCP JSON-RPC requests."""
+    try:
+        logger.debug("Received MCP request: %s %s", request.method, request.url)
         
-        elif method == 'tools/call':
-            tool_name = params.get('name')
-            arguments = params.get('arguments', {})
-            
-            if tool_name not in tool_registry:
-                return JSONResponse({
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {"code": -32601, "message": f"Unknown tool: {tool_name}"}
-                })
-            
-            try:
-                handler = tool_registry[tool_name]["handler"]
-                result = await handler(**arguments)
-                logger.info(f"Successfully executed tool: {tool_name}")
-                
-                # Convert result to JSON-serializable format
-                if hasattr(result, '__dict__'):
-                    result = [{"type": "text", "text": str(result)}]
-                elif isinstance(result, list):
-                    # Handle list of TextContent objects
-                    json_result = []
-                    for item in result:
-                        if hasattr(item, 'type') and hasattr(item, 'text'):
-                            json_result.append({"type": item.type, "text": item.text})
-                        else:
-                            json_result.append({"type": "text", "text": str(item)})
-                    result = json_result
-                else:
-                    result = [{"type": "text", "text": str(result)}]
-                
-                return JSONResponse({
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {"content": result}
-                })
-                
-            except Exception as e:
-                logger.error(f"Error executing tool {tool_name}: {str(e)}")
-                return JSONResponse({
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {"code": -32603, "message": f"Tool execution error: {str(e)}"}
-                })
+        data = orjson.loads(await request.body())
+        logger.debug("Request data: %s", data)
         
-        else:
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": -32601, "message": f"Unknown method: {method}"}
-            })
+        if isinstance(data, list):
+            return await _dispatch_batch(data)
+        return await _dispatch(data)
     
     except Exception as e:
-        logger.error(f"Error handling MCP request: {str(e)}")
-        logger.error(f"Error type: {type(e)}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return JSONResponse({
-            "jsonrpc": "2.0",
-            "id": None,
-            "error": {"code": -32603, "message": f"Internal server error: {str(e)}"}
-        })
-
-async def health_check(request: Request) -> JSONResponse:
-    """Health check endpoint."""
-    return JSONResponse({
+        logger.exception("Error handling MCP request: %s", e)
+        return _err(None, -32603, f"Internal server error: {str(e)}")
+
+# Health check endpoint. A Response is itself an ASGI app, so the route
+# serves this prebuilt instance without building a Request per probe.
+health_check = Response(
+    orjson.dumps({
         "status": "healthy",
         "service": "simple-mcp-http-server"
-    })
+    }),
+    media_type="application/json",
+)
+
+# Maximum number of deployment events buffered per SSE connection
+SSE_QUEUE_SIZE = 128
+
+_STREAM_END = object()
+
+_SSE_CONNECTED = b"event: connected\n"
+
+async def _pump(source, queue: asyncio.Queue) -> None:
+    """Copy events from an async iterator into a bounded queue.
+    
+    Blocks on a full queue, which holds the source back until the consumer
+    catches up. Ends with ``_STREAM_END``, or the exception that stopped
+    the source.
+    """
+    try:
+        async for item in source:
+            await queue.put(item)
+    except Exception as e:
+        await queue.put(e)
+        return
+    finally:
+        # Close the source even when cancelled while blocked on a full queue
+        await source.aclose()
+    await queue.put(_STREAM_END)
 
 async def sse_deployment_stream(request: Request) -> StreamingResponse:
     """SSE endpoint for real-time deployment monitoring."""
     deployment_uuid = request.path_params.get('deployment_uuid')
     
     if not deployment_uuid:
-        return JSONResponse({"error": "deployment_uuid required"}, status_code=400)
-    
-    # Check authorization for SSE endpoint
-    auth_header = request.headers.get('authorization')
-    expected_key = os.getenv('MCP_API_KEY', 'demo-api-key-123')
-    
-    if not auth_header or not auth_header.startswith('Bearer '):
-        return JSONResponse({"error": "Missing Authorization header"}, status_code=401)
+        return ORJSONResponse({"error": "deployment_uuid required"}, status_code=400)
     
-    token = auth_header[7:]  # Remove 'Bearer ' prefix  
-    if token != expected_key:
-        return JSONResponse({"error": "Invalid API key"}, status_code=401)
-    
-    logger.info(f"Starting SSE deployment stream for {deployment_uuid}")
+    logger.info("Starting SSE deployment stream for %s", deployment_uuid)
     
     async def generate_sse_stream():
         """Generate SSE stream for deployment updates."""
+        # The bounded queue makes the monitor wait on a slow client instead
+        # of piling events up in memory
+        queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+        producer = asyncio.create_task(
+            _pump(deployment_monitor.get_deployment_stream(deployment_uuid), queue)
+        )
         try:
             # Send SSE headers
-            yield "event: connected\n"
-            yield f"data: {{\"message\": \"Connected to deployment {deployment_uuid}\"}}\n\n"
+            yield _SSE_CONNECTED
+            yield b'data: ' + orjson.dumps({"message": f"Connected to deployment {deployment_uuid}"}) + b'\n\n'
             
             # Stream deployment updates
-            async for event_data in deployment_monitor.get_deployment_stream(deployment_uuid):
+            while True:
+                event_data = await queue.get()
+                if event_data is _STREAM_END:
+                    break
+                if isinstance(event_data, Exception):
+                    raise event_data
                 yield event_data
                 
         except asyncio.CancelledError:
-            logger.info(f"SSE stream cancelled for deployment {deployment_uuid}")
+            logger.info("SSE stream cancelled for deployment %s", deployment_uuid)
         except Exception as e:
-            logger.error(f"Error in SSE stream for deployment {deployment_uuid}: {e}")
-            yield f"data: {{\"error\": \"{str(e)}\"}}\n\n"
+            logger.error("Error in SSE stream for deployment %s: %s", deployment_uuid, e)
+            yield b'data: ' + orjson.dumps({"error": str(e)}) + b'\n\n'
+        finally:
+            # Wait for the producer to unwind so the monitor stream is closed
+            # before this connection is torn down
+            producer.cancel()
+            await asyncio.wait([producer])
     
     return StreamingResponse(
         generate_sse_stream(),
@@ -244,13 +453,20 @@ async def sse_deployment_stream(request: Request) -> StreamingResponse:
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
             "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Headers": "Authorization"
         }
     )
 
+_mcp_server = None
+
 def create_mcp_server() -> Server:
-    """Create the MCP server with tools."""
+    """Return the process-wide MCP server, creating it on first use."""
+    global _mcp_server
+    if _mcp_server is not None:
+        return _mcp_server
+    
     setup_tools()
     
     server = Server("python-mcp-server")
@@ -261,44 +477,36 @@ def create_mcp_server() -> Server:
         if name not in tool_registry:
             raise ValueError(f"Unknown tool: {name}")
         
-        handler = tool_registry[name]["handler"]
         try:
-            result = await handler(**arguments)
-            # Convert result to proper format
-            if isinstance(result, list):
-                # Handle list of TextContent objects
-                json_result = []
-                for item in result:
-                    if hasattr(item, 'type') and hasattr(item, 'text'):
-                        json_result.append(TextContent(type=item.type, text=item.text))
-                    else:
-                        json_result.append(TextContent(type="text", text=str(item)))
-                return json_result
-            elif isinstance(result, TextContent):
-                return [result]
-            else:
-                return [TextContent(type="text", text=str(result))]
+            return await _call_tool(name, arguments)
         except Exception as e:
-            logger.error(f"Error executing tool {name}: {str(e)}")
+            logger.error("Error executing tool %s: %s", name, e)
             return [TextContent(type="text", text=f"Error: {str(e)}")]
     
     @server.list_tools()
     async def list_tools() -> List[Tool]:
-        tools = []
-        for tool_name, tool_info in tool_registry.items():
-            tools.append(tool_info["definition"])
-        return tools
+        return _tool_definitions
     
+    _mcp_server = server
     return server
 
 # SSE endpoints removed - use HTTP transport only
 
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    """Register tools once per process and release shared clients on shutdown."""
+    setup_tools()
+    try:
+        yield
+    finally:
+        close_http_session()
+        close_coolify_session()
+
 def create_app() -> Starlette:
     """Create the Starlette application with HTTP transport only."""
-    setup_tools()
-    
     app = Starlette(
         debug=False,
+        lifespan=lifespan,
         routes=[
             # HTTP endpoints
             Route("/mcp", handle_mcp_request, methods=["POST"]),
@@ -309,11 +517,17 @@ def create_app() -> Starlette:
         ],
     )
     
+    # Compress large JSON results; text/event-stream responses are left alone
+    app.add_middleware(GZipMiddleware, minimum_size=512)
+    
+    # Auth is added after compression and before CORS, so CORS stays
+    # outermost and still answers preflights
+    app.add_middleware(AuthMiddleware)
+    
     # Add CORS middleware
-    allowed_origins = os.getenv("ALLOWED_ORIGINS", "").split(",") if os.getenv("ALLOWED_ORIGINS") else ["*"]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=allowed_origins,
+        allow_origins=CONFIG.allowed_origins,
         allow_credentials=True,
         allow_methods=["GET", "POST", "OPTIONS"],
         allow_headers=["*"],
@@ -323,18 +537,29 @@ def create_app() -> Starlette:
 
 def main():
     """CLI entry point."""
-    host = os.getenv("HOST", "0.0.0.0")
-    port = int(os.getenv("PORT", "3009"))
-    log_level = os.getenv("LOG_LEVEL", "INFO").lower()
+    host, port = CONFIG.host, CONFIG.port
     
-    logger.info(f"Starting Python MCP server on {host}:{port}")
+    logger.info("Starting Python MCP server on %s:%s", host, port)
     logger.info("Available endpoints:")
-    logger.info(f"  HTTP: http://{host}:{port}/mcp")
-    logger.info(f"  Health: http://{host}:{port}/health")
-    logger.info(f"  SSE Deployment Stream: http://{host}:{port}/sse/deployment/{{deployment_uuid}}")
+    logger.info("  HTTP: http://%s:%s/mcp", host, port)
+    logger.info("  Health: http://%s:%s/health", host, port)
+    logger.info("  SSE Deployment Stream: http://%s:%s/sse/deployment/{deployment_uuid}", host, port)
     
-    app = create_app()
-    uvicorn.run(app, host=host, port=port, log_level=log_level, access_log=True)
+    # The app is passed as an import string so uvicorn can spawn WORKERS processes
+    uvicorn.run(
+        "mcp_server:create_app",
+        factory=True,
+        host=host,
+        port=port,
+        log_level=CONFIG.log_level,
+        loop=_EVENT_LOOP,
+        http="httptools",
+        workers=CONFIG.workers,
+        backlog=CONFIG.backlog,
+        timeout_keep_alive=CONFIG.timeout_keep_alive,
+        limit_concurrency=CONFIG.limit_concurrency,
+        access_log=False,
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
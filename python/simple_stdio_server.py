@@ -4,8 +4,13 @@ Simple MCP stdio server for Claude Code CLI.
 """
 
 import asyncio
-import json
+import functools
+import os
+import select
 import sys
+
+import orjson
+
 from tools.math_tools import add_numbers, multiply_numbers, calculate_percentage
 from tools.text_tools import string_operations, word_count, format_text
 from tools.crawl4ai_tools import crawl_url_with_options
@@ -97,6 +102,9 @@ TOOLS = {
     }
 }
 
+# tools/list never changes, so build the list once
+TOOLS_LIST = list(TOOLS.values())
+
 TOOL_HANDLERS = {
     "add-numbers": add_numbers,
     "multiply-numbers": multiply_numbers,
@@ -108,108 +116,146 @@ TOOL_HANDLERS = {
 }
 
 
-async def handle_request(request):
-    """Handle a JSON-RPC request."""
+# Response envelopes are assembled from pre-encoded pieces; only the id and,
+# for tools/call, the tool output are serialized per request
+_RESPONSE_PREFIX = b'{"jsonrpc":"2.0","id":'
+_INIT_SUFFIX = b',"result":' + orjson.dumps({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {},
+        "logging": {}
+    },
+    "serverInfo": {
+        "name": "python-mcp-tools",
+        "version": "1.0.0"
+    }
+}) + b'}'
+_TOOLS_LIST_SUFFIX = b',"result":' + orjson.dumps({"tools": TOOLS_LIST}) + b'}'
+
+
+def error_response(request_id, code: int, message: str) -> bytes:
+    """Encode a JSON-RPC error response."""
+    return orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": code,
+            "message": message
+        }
+    })
+
+
+async def handle_request(request) -> bytes:
+    """Handle a JSON-RPC request and return the encoded response."""
     try:
         method = request.get("method")
         params = request.get("params", {})
         request_id = request.get("id")
 
         if method == "initialize":
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {},
-                        "logging": {}
-                    },
-                    "serverInfo": {
-                        "name": "python-mcp-tools",
-                        "version": "1.0.0"
-                    }
-                }
-            }
+            return _RESPONSE_PREFIX + orjson.dumps(request_id) + _INIT_SUFFIX
         
         elif method == "tools/list":
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "tools": list(TOOLS.values())
-                }
-            }
+            return _RESPONSE_PREFIX + orjson.dumps(request_id) + _TOOLS_LIST_SUFFIX
         
         elif method == "tools/call":
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
             
-            if tool_name not in TOOL_HANDLERS:
+            handler = TOOL_HANDLERS.get(tool_name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {tool_name}")
             
-            handler = TOOL_HANDLERS[tool_name]
             result = await handler(**arguments)
             
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "content": [{"type": "text", "text": content.text} for content in result]
-                }
-            }
+            return (
+                _RESPONSE_PREFIX + orjson.dumps(request_id) + b',"result":'
+                + orjson.dumps({"content": [{"type": "text", "text": content.text} for content in result]})
+                + b'}'
+            )
         
         else:
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {method}"
-                }
-            }
+            return error_response(request_id, -32601, f"Method not found: {method}")
 
     except Exception as e:
-        return {
-            "jsonrpc": "2.0",
-            "id": request.get("id"),
-            "error": {
-                "code": -32603,
-                "message": f"Internal error: {str(e)}"
-            }
-        }
+        return error_response(request.get("id"), -32603, f"Internal error: {str(e)}")
+
+
+# Responses are written to the raw stdout descriptor
+STDOUT_FD = 1
+
+# Longest JSON-RPC line accepted on stdin
+STDIN_LINE_LIMIT = 16 * 1024 * 1024
+
+
+async def open_stdin_reader():
+    """Return an awaitable readline for stdin.
+    
+    Pipes and terminals are read directly on the event loop. A regular file
+    redirected to stdin can't be watched by the loop, so it is read on a
+    worker thread instead.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=STDIN_LINE_LIMIT)
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except (ValueError, NotImplementedError):
+        return functools.partial(asyncio.to_thread, sys.stdin.buffer.readline)
+    return reader.readline
+
+
+def write_message(payload: bytes) -> None:
+    """Write one encoded JSON-RPC message to stdout as a single line.
+    
+    Goes straight to the file descriptor, bypassing sys.stdout's buffer,
+    and loops because a pipe may accept a large message in parts. When
+    stdin and stdout share one tty or socket, connect_read_pipe has made
+    stdout non-blocking too, so a full buffer waits for writability
+    instead of losing the rest of the message.
+    """
+    data = memoryview(payload + b"\n")
+    while data:
+        try:
+            data = data[os.write(STDOUT_FD, data):]
+        except BlockingIOError:
+            select.select([], [STDOUT_FD], [])
 
 
 async def main():
     """Main stdio loop."""
+    readline = await open_stdin_reader()
     while True:
         try:
-            line = await asyncio.to_thread(sys.stdin.readline)
+            line = await readline()
             if not line:
                 break
                 
             line = line.strip()
+            # Skip blank and keepalive lines without invoking the parser
             if not line:
                 continue
+            # Batches are not supported, but the client still gets a reply
+            if line[0] == ord("["):
+                write_message(error_response(None, -32600, "Batch requests not supported"))
+                continue
                 
-            request = json.loads(line)
+            request = orjson.loads(line)
+            if not isinstance(request, dict):
+                write_message(error_response(None, -32600, "Invalid Request"))
+                continue
             response = await handle_request(request)
             
-            print(json.dumps(response), flush=True)
+            write_message(response)
             
-        except json.JSONDecodeError:
-            continue
         except Exception as e:
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {
-                    "code": -32700,
-                    "message": f"Parse error: {str(e)}"
-                }
-            }
-            print(json.dumps(error_response), flush=True)
+            write_message(error_response(None, -32700, f"Parse error: {str(e)}"))
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:  # uvloop is unavailable on Windows
+        pass
+    else:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Tests for the Coolify response caches in tools.coolify_tools.base."""
+
+import asyncio
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("urllib3")
+pytest.importorskip("mcp")
+
+from tools.coolify_tools import base
+
+BASE_URL = "https://coolify.example.com"
+API = f"{BASE_URL}/api/v1"
+
+
+class RecordingSession:
+    """Stand-in for the pooled session that answers from a status table."""
+
+    def __init__(self):
+        self.calls = []
+        self.statuses = {}
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        response = requests.Response()
+        response.status_code = self.statuses.get((method, url), 200)
+        response.url = url
+        response._content = b'{"ok": true}'
+        return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setenv("COOLIFY_BASE_URL", BASE_URL)
+    monkeypatch.setenv("COOLIFY_API_TOKEN", "test-token")
+    monkeypatch.setattr(base, "CACHE_TTL_OVERRIDE", None)
+    base.reset_coolify_config()
+    recording = RecordingSession()
+    monkeypatch.setattr(base, "get_coolify_session", lambda: recording)
+    yield recording
+    base.reset_coolify_config()
+
+
+def request(method, url):
+    return asyncio.run(base.coolify_request(method, url, timeout=30))
+
+
+# Negative (404) cache
+
+def test_not_found_on_poll_path_is_replayed(session):
+    url = f"{API}/applications/missing"
+    session.statuses[("GET", url)] = 404
+
+    assert request("GET", url).status_code == 404
+    assert request("GET", url).status_code == 404
+    assert len(session.calls) == 1
+
+
+@pytest.mark.parametrize("path", ["/applications/app-1/envs", "/projects", "/deployments/applications/app-1"])
+def test_not_found_elsewhere_is_not_replayed(session, path):
+    url = API + path
+    session.statuses[("GET", url)] = 404
+
+    request("GET", url)
+    request("GET", url)
+    assert len(session.calls) == 2
+
+
+def test_not_found_entry_expires(session, monkeypatch):
+    url = f"{API}/deployments/missing"
+    session.statuses[("GET", url)] = 404
+    monkeypatch.setattr(base, "NOT_FOUND_TTL", 0)
+
+    request("GET", url)
+    request("GET", url)
+    assert len(session.calls) == 2
+
+
+def test_write_clears_remembered_not_found(session):
+    url = f"{API}/applications/new-app"
+    session.statuses[("GET", url)] = 404
+
+    request("GET", url)
+    request("POST", f"{API}/applications/public")
+    session.statuses[("GET", url)] = 200
+    assert request("GET", url).status_code == 200
+    assert [method for method, _ in session.calls] == ["GET", "POST", "GET"]
+
+
+def test_invalidate_all_clears_remembered_not_found(session):
+    url = f"{API}/applications/new-app"
+    session.statuses[("GET", url)] = 404
+    request("GET", url)
+
+    assert base.invalidate_cache() == 1
+    request("GET", url)
+    assert len(session.calls) == 2
+
+
+# Listing cache
+
+def test_cached_get_reuses_body_within_ttl(session):
+    first = asyncio.run(base.cached_get("/projects", ttl=60))
+    second = asyncio.run(base.cached_get("/projects", ttl=60))
+
+    assert first == second == {"ok": True}
+    assert session.calls == [("GET", f"{API}/projects")]
+
+
+def test_write_invalidates_application_listing_only(session):
+    asyncio.run(base.cached_get("/applications", ttl=60))
+    asyncio.run(base.cached_get("/projects", ttl=60))
+
+    request("DELETE", f"{API}/applications/app-1")
+
+    assert "/applications" not in base._cache
+    assert "/projects" in base._cache
+
+
+def test_write_invalidates_listing_even_when_it_fails(session):
+    asyncio.run(base.cached_get("/applications", ttl=60))
+
+    def fail(method, url, **kwargs):
+        raise requests.exceptions.ConnectionError("down")
+
+    session.request = fail
+    with pytest.raises(requests.exceptions.ConnectionError):
+        request("POST", f"{API}/applications/public")
+
+    assert "/applications" not in base._cache
+
+
+def test_invalidate_single_path(session):
+    asyncio.run(base.cached_get("/projects", ttl=60))
+    asyncio.run(base.cached_get("/servers", ttl=60))
+
+    assert base.invalidate_cache("/projects") == 1
+    assert base.invalidate_cache("/projects") == 0
+    assert "/servers" in base._cache
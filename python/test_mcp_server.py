@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Tests for the tools/call result cache and JSON-RPC batch handling in mcp_server."""
+
+import asyncio
+
+import orjson
+import pytest
+
+for module in ("mcp", "starlette", "uvicorn", "requests", "bs4"):
+    pytest.importorskip(module)
+
+import mcp_server
+from mcp.types import TextContent
+
+
+@pytest.fixture
+def counting_tools(monkeypatch):
+    """Register a cacheable and a non-cacheable echo tool that count their calls."""
+    calls = {"cached-echo": 0, "plain-echo": 0}
+
+    def make_handler(name):
+        async def handler(**arguments) -> list[TextContent]:
+            calls[name] += 1
+            return [TextContent(type="text", text=orjson.dumps(arguments).decode())]
+        return handler
+
+    for name, cacheable in (("cached-echo", True), ("plain-echo", False)):
+        handler = make_handler(name)
+        entry = {"handler": handler, "to_contents": mcp_server._converter_for(handler)}
+        if cacheable:
+            entry["cacheable"] = True
+        monkeypatch.setitem(mcp_server.tool_registry, name, entry)
+
+    mcp_server._result_cache.clear()
+    yield calls
+    mcp_server._result_cache.clear()
+
+
+def call(name, arguments):
+    return asyncio.run(mcp_server._call_tool(name, arguments))
+
+
+def batch(items):
+    response = asyncio.run(mcp_server._dispatch_batch(items))
+    return response, (orjson.loads(response.body) if response.body else None)
+
+
+# Result cache
+
+def test_cacheable_tool_is_served_from_cache(counting_tools):
+    first = call("cached-echo", {"a": 1, "b": 2})
+    second = call("cached-echo", {"a": 1, "b": 2})
+
+    assert counting_tools["cached-echo"] == 1
+    assert second is first
+
+
+def test_cache_key_ignores_argument_order(counting_tools):
+    call("cached-echo", {"a": 1, "b": 2})
+    call("cached-echo", {"b": 2, "a": 1})
+
+    assert counting_tools["cached-echo"] == 1
+    assert len(mcp_server._result_cache) == 1
+
+
+def test_different_arguments_are_cached_separately(counting_tools):
+    call("cached-echo", {"a": 1})
+    call("cached-echo", {"a": 2})
+
+    assert counting_tools["cached-echo"] == 2
+    assert len(mcp_server._result_cache) == 2
+
+
+def test_non_cacheable_tool_always_runs(counting_tools):
+    call("plain-echo", {"a": 1})
+    call("plain-echo", {"a": 1})
+
+    assert counting_tools["plain-echo"] == 2
+    assert not mcp_server._result_cache
+
+
+def test_large_arguments_bypass_cache(counting_tools):
+    text = "x" * (mcp_server.RESULT_CACHE_MAX_ARGS_BYTES + 1)
+    call("cached-echo", {"text": text})
+    call("cached-echo", {"text": text})
+
+    assert counting_tools["cached-echo"] == 2
+    assert not mcp_server._result_cache
+
+
+def test_least_recently_used_entry_is_evicted(counting_tools, monkeypatch):
+    monkeypatch.setattr(mcp_server, "RESULT_CACHE_SIZE", 2)
+    call("cached-echo", {"n": 1})
+    call("cached-echo", {"n": 2})
+    call("cached-echo", {"n": 1})  # refresh n=1 so n=2 is the oldest
+    call("cached-echo", {"n": 3})
+
+    assert len(mcp_server._result_cache) == 2
+    call("cached-echo", {"n": 1})
+    assert counting_tools["cached-echo"] == 3
+    call("cached-echo", {"n": 2})
+    assert counting_tools["cached-echo"] == 4
+
+
+def test_passthrough_falls_back_for_non_text_content_items():
+    assert mcp_server._passthrough_contents(["plain", {"k": "v"}]) == [
+        TextContent(type="text", text="plain"),
+        TextContent(type="text", text="{'k': 'v'}"),
+    ]
+
+
+# Batch handling
+
+def test_batch_answers_each_request(counting_tools):
+    response, body = batch([
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+         "params": {"name": "plain-echo", "arguments": {"a": 1}}},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+    ])
+
+    assert [item["id"] for item in body] == [1, 2]
+    assert body[0]["result"]["content"][0]["text"] == '{"a":1}'
+
+
+def test_batch_leaves_out_notifications(counting_tools):
+    response, body = batch([
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "id": 7, "method": "tools/list"},
+    ])
+
+    assert [item["id"] for item in body] == [7]
+
+
+def test_batch_of_only_notifications_has_no_body():
+    response, body = batch([{"jsonrpc": "2.0", "method": "notifications/initialized"}])
+
+    assert response.status_code == 204
+    assert body is None
+
+
+def test_empty_batch_is_invalid_request():
+    response, body = batch([])
+
+    assert body["error"]["code"] == -32600
+    assert body["id"] is None
+
+
+@pytest.mark.parametrize("item", [
+    {"jsonrpc": "2.0", "id": 1, "method": 1},
+    {"jsonrpc": "2.0", "id": 1, "method": []},
+    {"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": "oops"},
+])
+def test_malformed_batch_item_fails_alone(item):
+    response, body = batch([item, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}])
+
+    assert body[0] == {"jsonrpc": "2.0", "id": 1, "error": {"code": -32600, "message": "Invalid Request"}}
+    assert body[1]["id"] == 2
+    assert "result" in body[1]
@@ -1,60 +1,51 @@
 """Application management tools for Coolify API."""
 
+import asyncio
 import os
+import orjson
 import requests
 import mcp.types as types
-from .base import get_coolify_headers, get_coolify_base_url, logger
+from .base import get_coolify_headers, get_coolify_base_url, coolify_request, coolify_tool, cached_get, coalesce, logger, SENSITIVE_KEY_RE
+from utils.http import get_http_session
 from utils.error_handler import handle_requests_error, format_enhanced_error, get_resource_not_found_message
 
 
-# Helper function for enhanced error handling with retry logic
-async def make_request_with_retry(method: str, url: str, headers: dict, max_retries: int = 3, **kwargs) -> requests.Response:
-    """Make HTTP request with retry logic and enhanced error handling."""
-    import time
+# Helper function for Coolify requests with enhanced error handling
+async def make_request_with_retry(method: str, url: str, headers: dict, **kwargs) -> requests.Response:
+    """Make one HTTP request and raise for error statuses.
     
-    for attempt in range(max_retries):
-        try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, timeout=30, **kwargs)
-            elif method.upper() == 'POST':
-                response = requests.post(url, headers=headers, timeout=30, **kwargs)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, headers=headers, timeout=30, **kwargs)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=30, **kwargs)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            return response
-            
-        except requests.exceptions.ConnectionError as e:
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # Exponential backoff
-                logger.warning(f"Connection error on attempt {attempt + 1}, retrying in {wait_time}s: {e}")
-                time.sleep(wait_time)
-                continue
-            raise
-        except requests.exceptions.Timeout as e:
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt
-                logger.warning(f"Timeout on attempt {attempt + 1}, retrying in {wait_time}s: {e}")
-                time.sleep(wait_time)
-                continue
-            raise
-        except requests.exceptions.HTTPError as e:
-            # Don't retry HTTP errors (4xx, 5xx)
-            raise
-        except Exception as e:
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt
-                logger.warning(f"Request failed on attempt {attempt + 1}, retrying in {wait_time}s: {e}")
-                time.sleep(wait_time)
-                continue
-            raise
+    Retries are left to the session adapter, which only repeats requests
+    Coolify cannot have acted on; a timed-out POST may already have created
+    the resource, so nothing is resent here.
+    """
+    method = method.upper()
+    if method not in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    response = await coolify_request(method, url, headers=headers, timeout=30, **kwargs)
+    response.raise_for_status()
+    return response
 
 
 # Core Application Management Functions
+def _format_app_line(app: dict) -> str:
+    """Format one application as a bullet line for list output."""
+    name = app.get('name', 'N/A')
+    uuid = app.get('uuid', 'N/A')
+    status = app.get('status', 'N/A')
+    git_repo = app.get('git_repository', 'N/A')
+    build_pack = app.get('build_pack', 'N/A')
+    last_online = app.get('last_online_at', 'Never')
+    
+    app_line = f"• **{name}** (UUID: `{uuid}`): {status}"
+    if git_repo != 'N/A':
+        app_line += f"\n  └─ Repository: {git_repo}"
+    if build_pack != 'N/A':
+        app_line += f" | Build: {build_pack}"
+    if last_online != 'Never':
+        app_line += f" | Last online: {last_online}"
+    return app_line
+
 async def list_coolify_applications(**kwargs) -> list[types.TextContent]:
     """List all applications or filter by project UUID."""
     try:
@@ -68,11 +59,8 @@ async def list_coolify_applications(**kwargs) -> list[types.TextContent]:
         if project_uuid == "":
             project_uuid = None
         
-        # Use the correct endpoint that gets all applications
-        response = requests.get(f"{base_url}/applications", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        applications = response.json()
+        # Use the correct endpoint that gets all applications; project filtering happens locally
+        applications = await cached_get("/applications", ttl=5)
         logger.info(f"Successfully retrieved applications")
         
         if isinstance(applications, list):
@@ -80,9 +68,9 @@ async def list_coolify_applications(**kwargs) -> list[types.TextContent]:
             if project_uuid:
                 # Get project details to find environment IDs
                 try:
-                    project_response = requests.get(f"{base_url}/projects/{project_uuid}", headers=headers, timeout=30)
+                    project_response = await coolify_request("GET", f"{base_url}/projects/{project_uuid}", headers=headers, timeout=30)
                     if project_response.status_code == 200:
-                        project_data = project_response.json()
+                        project_data = orjson.loads(project_response.content)
                         environment_ids = [env.get('id') for env in project_data.get('environments', [])]
                         
                         filtered_apps = []
@@ -96,24 +84,7 @@ async def list_coolify_applications(**kwargs) -> list[types.TextContent]:
                 except Exception as filter_error:
                     logger.error(f"Error filtering by project {project_uuid}: {filter_error}")
             
-            app_info = []
-            for app in applications:
-                name = app.get('name', 'N/A')
-                uuid = app.get('uuid', 'N/A')
-                status = app.get('status', 'N/A')
-                git_repo = app.get('git_repository', 'N/A')
-                build_pack = app.get('build_pack', 'N/A')
-                last_online = app.get('last_online_at', 'Never')
-                
-                app_line = f"• **{name}** (UUID: `{uuid}`): {status}"
-                if git_repo != 'N/A':
-                    app_line += f"\n  └─ Repository: {git_repo}"
-                if build_pack != 'N/A':
-                    app_line += f" | Build: {build_pack}"
-                if last_online != 'Never':
-                    app_line += f" | Last online: {last_online}"
-                    
-                app_info.append(app_line)
+            app_info = [_format_app_line(app) for app in applications]
             
             title = f"Applications in project {project_uuid}" if project_uuid else "All Applications"
             result = f"{title}:\n" + "\n".join(app_info)
@@ -127,6 +98,54 @@ async def list_coolify_applications(**kwargs) -> list[types.TextContent]:
         return [types.TextContent(type="text", text=f"Error listing applications: {e}")]
 
 
+async def list_applications_multi(project_uuids: list[str] = None) -> list[types.TextContent]:
+    """List applications grouped by project, fetching all projects concurrently."""
+    try:
+        if not project_uuids:
+            projects = await cached_get("/projects", ttl=10)
+            project_uuids = [project.get('uuid') for project in projects if project.get('uuid')] if isinstance(projects, list) else []
+        
+        if not project_uuids:
+            return [types.TextContent(type="text", text="No projects found")]
+        
+        # One shared application listing plus every project's details, all in flight together
+        applications, *project_results = await asyncio.gather(
+            cached_get("/applications", ttl=5),
+            *(cached_get(f"/projects/{uuid}", ttl=5) for uuid in project_uuids),
+            return_exceptions=True,
+        )
+        if isinstance(applications, Exception):
+            raise applications
+        if not isinstance(applications, list):
+            applications = []
+        
+        apps_by_env = {}
+        for app in applications:
+            apps_by_env.setdefault(app.get('environment_id'), []).append(app)
+        
+        parts = []
+        for uuid, project in zip(project_uuids, project_results):
+            if isinstance(project, Exception):
+                parts.append(f"**Project `{uuid}`**: Error retrieving ({project})")
+                continue
+            
+            name = project.get('name', 'N/A') if isinstance(project, dict) else 'N/A'
+            environments = project.get('environments', []) if isinstance(project, dict) else []
+            project_apps = [app for env in environments for app in apps_by_env.get(env.get('id'), [])]
+            
+            block = f"**{name}** (UUID: `{uuid}`) - {len(project_apps)} application(s)"
+            if project_apps:
+                block += "\n" + "\n".join(_format_app_line(app) for app in project_apps)
+            parts.append(block)
+        
+        logger.info(f"Successfully listed applications for {len(project_uuids)} projects")
+        return [types.TextContent(type="text", text="Applications by Project:\n\n" + "\n\n".join(parts))]
+        
+    except Exception as e:
+        logger.error(f"Failed to list applications for multiple projects: {e}")
+        return [types.TextContent(type="text", text=f"Error listing applications: {e}")]
+
+
 async def create_github_application(
     project_uuid: str = None,
     server_uuid: str = None,
@@ -224,27 +243,23 @@ coolify-create-github-app --project_uuid PROJECT_UUID --server_uuid SERVER_UUID
         }
         
         # Add optional fields if provided
-        if domains:
-            payload["domains"] = domains
-        if base_directory:
-            payload["base_directory"] = base_directory
-        if publish_directory:
-            payload["publish_directory"] = publish_directory
-        if install_command:
-            payload["install_command"] = install_command
-        if build_command:
-            payload["build_command"] = build_command
-        if start_command:
-            payload["start_command"] = start_command
-        if ports_exposes:
-            payload["ports_exposes"] = ports_exposes
+        optional = (
+            ("domains", domains),
+            ("base_directory", base_directory),
+            ("publish_directory", publish_directory),
+            ("install_command", install_command),
+            ("build_command", build_command),
+            ("start_command", start_command),
+            ("ports_exposes", ports_exposes),
+        )
+        payload.update({key: value for key, value in optional if value})
         
         logger.info(f"Creating application {name} from {git_repository}")
         
-        response = requests.post(f"{base_url}/applications/public", headers=headers, json=payload, timeout=60)
+        response = await coolify_request("POST", f"{base_url}/applications/public", headers=headers, json=payload, timeout=60)
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         app_uuid = result.get('uuid', 'N/A')
         
         success_msg = f"""✅ Application created successfully!
@@ -324,10 +339,18 @@ coolify-list-applications
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/applications/{app_uuid}", headers=headers, timeout=30)
+        # The application and its environment variables are independent, so fetch both at once;
+        # concurrent lookups of the same application share one pair of requests
+        response, env_response = await coalesce(f"/applications/{app_uuid}", lambda: asyncio.gather(
+            coolify_request("GET", f"{base_url}/applications/{app_uuid}", headers=headers, timeout=30),
+            coolify_request("GET", f"{base_url}/applications/{app_uuid}/envs", headers=headers, timeout=30),
+            return_exceptions=True,
+        ))
+        if isinstance(response, Exception):
+            raise response
         response.raise_for_status()
         
-        app_data = response.json()
+        app_data = orjson.loads(response.content)
         logger.info(f"Successfully retrieved application data for {app_uuid}")
         
         # Extract key application information
@@ -356,24 +379,28 @@ Start Command: {start_command}
 Dockerfile Location: {dockerfile_location}
 """
         
-        # Try to get environment variables
+        # Add environment variables if they could be retrieved
+        parts = [result]
+        append = parts.append
         try:
-            env_response = requests.get(f"{base_url}/applications/{app_uuid}/envs", headers=headers, timeout=30)
+            if isinstance(env_response, Exception):
+                raise env_response
             if env_response.status_code == 200:
-                env_vars = env_response.json()
-                result += f"\nEnvironment Variables:\n"
+                env_vars = orjson.loads(env_response.content)
+                append("\nEnvironment Variables:\n")
                 if env_vars and isinstance(env_vars, list):
                     for env_var in env_vars:
                         key = env_var.get('key', 'N/A')
                         value = env_var.get('value', 'N/A')
                         # Mask sensitive values
-                        if any(sensitive in key.lower() for sensitive in ['token', 'key', 'secret', 'password']):
+                        if SENSITIVE_KEY_RE.search(key):
                             value = '***MASKED***'
-                        result += f"  {key}: {value}\n"
+                        append(f"  {key}: {value}\n")
                 else:
-                    result += "  No environment variables set\n"
+                    append("  No environment variables set\n")
         except Exception as env_error:
-            result += f"\nEnvironment Variables: Error retrieving ({env_error})\n"
+            append(f"\nEnvironment Variables: Error retrieving ({env_error})\n")
+        result = "".join(parts)
         
         return [types.TextContent(type="text", text=result)]
         
@@ -397,6 +424,7 @@ Dockerfile Location: {dockerfile_location}
 
 
 # Application Lifecycle Management
+@coolify_tool("restart application", "restarting application")
 async def restart_application(app_uuid: str = None) -> list[types.TextContent]:
     """Restart an application in Coolify."""
     
@@ -447,142 +475,69 @@ coolify-list-applications
 ```
 """)]
     
-    try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.post(f"{base_url}/applications/{app_uuid}/restart", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        result_data = response.json()
-        message = result_data.get('message', 'Application restart initiated')
-        
-        logger.info(f"Successfully restarted application {app_uuid}")
-        return [types.TextContent(type="text", text=f"✅ {message}")]
-        
-    except requests.exceptions.HTTPError as e:
-        error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
-        logger.error(f"Failed to restart application {app_uuid}: {error_msg}")
-        return [types.TextContent(type="text", text=f"❌ Failed to restart application: {error_msg}")]
-    except Exception as e:
-        logger.error(f"Failed to restart application {app_uuid}: {e}")
-        return [types.TextContent(type="text", text=f"❌ Error restarting application: {e}")]
+    base_url = get_coolify_base_url()
+    headers = get_coolify_headers()
+    
+    response = await coolify_request("POST", f"{base_url}/applications/{app_uuid}/restart", headers=headers, timeout=30)
+    response.raise_for_status()
+    
+    result_data = orjson.loads(response.content)
+    message = result_data.get('message', 'Application restart initiated')
+    
+    logger.info(f"Successfully restarted application {app_uuid}")
+    return [types.TextContent(type="text", text=f"✅ {message}")]
 
 
+@coolify_tool("stop application", "stopping application")
 async def stop_application(app_uuid: str) -> list[types.TextContent]:
     """Stop an application in Coolify."""
-    try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.post(f"{base_url}/applications/{app_uuid}/stop", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        result_data = response.json()
-        message = result_data.get('message', 'Application stop initiated')
-        
-        logger.info(f"Successfully stopped application {app_uuid}")
-        return [types.TextContent(type="text", text=f"⏹️ {message}")]
-        
-    except requests.exceptions.HTTPError as e:
-        error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
-        logger.error(f"Failed to stop application {app_uuid}: {error_msg}")
-        return [types.TextContent(type="text", text=f"❌ Failed to stop application: {error_msg}")]
-    except Exception as e:
-        logger.error(f"Failed to stop application {app_uuid}: {e}")
-        return [types.TextContent(type="text", text=f"❌ Error stopping application: {e}")]
+    base_url = get_coolify_base_url()
+    headers = get_coolify_headers()
+    
+    response = await coolify_request("POST", f"{base_url}/applications/{app_uuid}/stop", headers=headers, timeout=30)
+    response.raise_for_status()
+    
+    result_data = orjson.loads(response.content)
+    message = result_data.get('message', 'Application stop initiated')
+    
+    logger.info(f"Successfully stopped application {app_uuid}")
+    return [types.TextContent(type="text", text=f"⏹️ {message}")]
 
 
+@coolify_tool("start application", "starting application")
 async def start_application(app_uuid: str) -> list[types.TextContent]:
     """Start an application in Coolify."""
-    try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.post(f"{base_url}/applications/{app_uuid}/start", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        result_data = response.json()
-        message = result_data.get('message', 'Application start initiated')
-        
-        logger.info(f"Successfully started application {app_uuid}")
-        return [types.TextContent(type="text", text=f"▶️ {message}")]
-        
-    except requests.exceptions.HTTPError as e:
-        error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
-        logger.error(f"Failed to start application {app_uuid}: {error_msg}")
-        return [types.TextContent(type="text", text=f"❌ Failed to start application: {error_msg}")]
-    except Exception as e:
-        logger.error(f"Failed to start application {app_uuid}: {e}")
-        return [types.TextContent(type="text", text=f"❌ Error starting application: {e}")]
+    base_url = get_coolify_base_url()
+    headers = get_coolify_headers()
+    
+    response = await coolify_request("POST", f"{base_url}/applications/{app_uuid}/start", headers=headers, timeout=30)
+    response.raise_for_status()
+    
+    result_data = orjson.loads(response.content)
+    message = result_data.get('message', 'Application start initiated')
+    
+    logger.info(f"Successfully started application {app_uuid}")
+    return [types.TextContent(type="text", text=f"▶️ {message}")]
 
 
+@coolify_tool("delete application", "deleting application")
 async def delete_application(app_uuid: str, confirm: bool = False) -> list[types.TextContent]:
     """Delete an application in Coolify."""
     if not confirm:
         return [types.TextContent(type="text", text="⚠️ Application deletion requires confirmation. Set 'confirm' parameter to true to proceed.")]
     
-    try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.delete(f"{base_url}/applications/{app_uuid}", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        logger.info(f"Successfully deleted application {app_uuid}")
-        return [types.TextContent(type="text", text=f"🗑️ Application {app_uuid} has been deleted successfully")]
-        
-    except requests.exceptions.HTTPError as e:
-        error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
-        logger.error(f"Failed to delete application {app_uuid}: {error_msg}")
-        return [types.TextContent(type="text", text=f"❌ Failed to delete application: {error_msg}")]
-    except Exception as e:
-        logger.error(f"Failed to delete application {app_uuid}: {e}")
-        return [types.TextContent(type="text", text=f"❌ Error deleting application: {e}")]
-
-
-async def get_application_logs(app_uuid: str, lines: int = 100) -> list[types.TextContent]:
-    """Get runtime logs for an application."""
-    try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        # Try to get application logs - this endpoint may vary depending on Coolify version
-        response = requests.get(f"{base_url}/applications/{app_uuid}/logs", headers=headers, timeout=30)
-        
-        if response.status_code == 404:
-            # Try alternative endpoint structure
-            response = requests.get(f"{base_url}/applications/{app_uuid}/containers/logs", headers=headers, timeout=30)
-        
-        response.raise_for_status()
-        
-        # Handle different response formats
-        if response.headers.get('content-type', '').startswith('application/json'):
-            logs_data = response.json()
-            if isinstance(logs_data, list):
-                recent_logs = logs_data[-lines:] if lines > 0 else logs_data
-                result = "\n".join([log.get('message', str(log)) for log in recent_logs])
-            else:
-                result = str(logs_data)
-        else:
-            # Plain text logs
-            log_lines = response.text.split('\n')
-            recent_logs = log_lines[-lines:] if lines > 0 else log_lines
-            result = '\n'.join(recent_logs)
-        
-        logger.info(f"Successfully retrieved logs for application {app_uuid}")
-        return [types.TextContent(type="text", text=f"📋 Application Logs ({lines} lines):\n\n{result}")]
-        
-    except requests.exceptions.HTTPError as e:
-        error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
-        logger.error(f"Failed to get logs for application {app_uuid}: {error_msg}")
-        return [types.TextContent(type="text", text=f"❌ Failed to get application logs: {error_msg}")]
-    except Exception as e:
-        logger.error(f"Failed to get logs for application {app_uuid}: {e}")
-        return [types.TextContent(type="text", text=f"❌ Error getting application logs: {e}")]
+    base_url = get_coolify_base_url()
+    headers = get_coolify_headers()
+    
+    response = await coolify_request("DELETE", f"{base_url}/applications/{app_uuid}", headers=headers, timeout=30)
+    response.raise_for_status()
+    
+    logger.info(f"Successfully deleted application {app_uuid}")
+    return [types.TextContent(type="text", text=f"🗑️ Application {app_uuid} has been deleted successfully")]
 
 
 # Deployment Management
+@coolify_tool("deploy application", "deploying application")
 async def deploy_application(app_uuid: str = None, force: bool = False) -> list[types.TextContent]:
     """Trigger a deployment for an existing application."""
     
@@ -634,42 +589,33 @@ coolify-list-applications
 ```
 """)]
     
-    try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        payload = {"uuid": app_uuid}
-        if force:
-            payload["force"] = True
-        
-        response = requests.post(f"{base_url}/deploy", headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        
-        result_data = response.json()
-        deployment_uuid = None
-        
-        if 'deployments' in result_data and result_data['deployments']:
-            deployment_info = result_data['deployments'][0]
-            deployment_uuid = deployment_info.get('deployment_uuid')
-            message = deployment_info.get('message', 'Deployment queued')
-            
-            result = f"🚀 {message}"
-            if deployment_uuid:
-                result += f"\nDeployment UUID: {deployment_uuid}"
-                result += f"\n\nUse 'coolify-get-deployment-logs' with UUID '{deployment_uuid}' to monitor progress."
-        else:
-            result = f"🚀 Deployment initiated for application {app_uuid}"
-        
-        logger.info(f"Successfully triggered deployment for application {app_uuid}")
-        return [types.TextContent(type="text", text=result)]
-        
-    except requests.exceptions.HTTPError as e:
-        error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
-        logger.error(f"Failed to deploy application {app_uuid}: {error_msg}")
-        return [types.TextContent(type="text", text=f"❌ Failed to deploy application: {error_msg}")]
-    except Exception as e:
-        logger.error(f"Failed to deploy application {app_uuid}: {e}")
-        return [types.TextContent(type="text", text=f"❌ Error deploying application: {e}")]
+    base_url = get_coolify_base_url()
+    headers = get_coolify_headers()
+    
+    payload = {"uuid": app_uuid}
+    if force:
+        payload["force"] = True
+    
+    response = await coolify_request("POST", f"{base_url}/deploy", headers=headers, json=payload, timeout=30)
+    response.raise_for_status()
+    
+    result_data = orjson.loads(response.content)
+    deployment_uuid = None
+    
+    if 'deployments' in result_data and result_data['deployments']:
+        deployment_info = result_data['deployments'][0]
+        deployment_uuid = deployment_info.get('deployment_uuid')
+        message = deployment_info.get('message', 'Deployment queued')
+        
+        result = f"🚀 {message}"
+        if deployment_uuid:
+            result += f"\nDeployment UUID: {deployment_uuid}"
+            result += f"\n\nUse 'coolify-get-deployment-logs' with UUID '{deployment_uuid}' to monitor progress."
+    else:
+        result = f"🚀 Deployment initiated for application {app_uuid}"
+    
+    logger.info(f"Successfully triggered deployment for application {app_uuid}")
+    return [types.TextContent(type="text", text=result)]
 
 
 # Health Check Management
@@ -734,7 +680,7 @@ async def test_health_endpoint(app_uuid: str) -> list[types.TextContent]:
         
         # Get application info first
         app_response = await make_request_with_retry('GET', f"{base_url}/applications/{app_uuid}", headers)
-        app_data = app_response.json()
+        app_data = orjson.loads(app_response.content)
         
         app_name = app_data.get('name', 'N/A')
         health_check_enabled = app_data.get('health_check_enabled', False)
@@ -784,14 +730,14 @@ async def test_health_endpoint(app_uuid: str) -> list[types.TextContent]:
                 # Test without auth first
                 test_response = None
                 try:
-                    test_response = requests.get(health_url, timeout=10)
+                    test_response = await asyncio.to_thread(get_http_session().get, health_url, timeout=10)
                 except requests.exceptions.SSLError as ssl_error:
                     # If HTTPS fails due to SSL issues, try HTTP as fallback
                     if health_url.startswith('https://'):
                         http_url = health_url.replace('https://', 'http://')
                         result += f"• ⚠️ HTTPS failed (SSL issue), trying HTTP: `{http_url}`\n"
                         try:
-                            test_response = requests.get(http_url, timeout=10)
+                            test_response = await asyncio.to_thread(get_http_session().get, http_url, timeout=10)
                             health_url = http_url  # Update for reporting
                         except Exception as http_error:
                             result += f"• Result: ❌ **Both HTTPS and HTTP failed**\n"
@@ -812,9 +758,9 @@ async def test_health_endpoint(app_uuid: str) -> list[types.TextContent]:
                     if test_response.status_code == 200:
                         result += f"• Result: ✅ **Healthy**\n"
                         try:
-                            health_data = test_response.json()
+                            health_data = orjson.loads(test_response.content)
                             result += f"• Response: {health_data}\n"
-                        except:
+                        except ValueError:
                             result += f"• Response: {test_response.text[:200]}...\n"
                     else:
                         result += f"• Result: ❌ **Unhealthy** (Status: {test_response.status_code})\n"
@@ -906,7 +852,7 @@ async def manage_domains(app_uuid: str, action: str, domain: str = None) -> list
         if action == "list":
             # Get current application info to list domains
             app_response = await make_request_with_retry('GET', f"{base_url}/applications/{app_uuid}", headers)
-            app_data = app_response.json()
+            app_data = orjson.loads(app_response.content)
             
             app_name = app_data.get('name', 'N/A')
             fqdn = app_data.get('fqdn', '')
@@ -930,7 +876,7 @@ async def manage_domains(app_uuid: str, action: str, domain: str = None) -> list
             
             # Get current domains
             app_response = await make_request_with_retry('GET', f"{base_url}/applications/{app_uuid}", headers)
-            app_data = app_response.json()
+            app_data = orjson.loads(app_response.content)
             
             current_domains = app_data.get('domains', '')
             domains_list = [d.strip() for d in current_domains.split(',') if d.strip()] if current_domains else []
@@ -1053,7 +999,7 @@ coolify-list-applications
         
         # Get current application info first
         app_response = await make_request_with_retry('GET', f"{base_url}/applications/{app_uuid}", headers)
-        app_data = app_response.json()
+        app_data = orjson.loads(app_response.content)
         
         app_name = app_data.get('name', 'N/A')
         current_fqdn = app_data.get('fqdn', '')
@@ -1167,7 +1113,7 @@ async def bulk_restart(app_uuids: str, parallel: bool = False) -> list[types.Tex
                     response = await make_request_with_retry(
                         'POST', f"{base_url}/applications/{app_uuid}/restart", headers
                     )
-                    return app_uuid, "success", response.json().get('message', 'Restart initiated')
+                    return app_uuid, "success", orjson.loads(response.content).get('message', 'Restart initiated')
                 except Exception as e:
                     return app_uuid, "failed", str(e)
             
@@ -1192,7 +1138,7 @@ async def bulk_restart(app_uuids: str, parallel: bool = False) -> list[types.Tex
                     response = await make_request_with_retry(
                         'POST', f"{base_url}/applications/{app_uuid}/restart", headers
                     )
-                    message = response.json().get('message', 'Restart initiated')
+                    message = orjson.loads(response.content).get('message', 'Restart initiated')
                     successful_restarts.append(f"✅ {app_uuid}: {message}")
                     
                 except Exception as e:
@@ -1239,13 +1185,13 @@ async def project_status(project_uuid: str, include_details: bool = False) -> li
         
         # Get project info
         project_response = await make_request_with_retry('GET', f"{base_url}/projects/{project_uuid}", headers)
-        project_data = project_response.json()
+        project_data = orjson.loads(project_response.content)
         
         project_name = project_data.get('name', 'N/A')
         
         # Get all applications and filter by project
         apps_response = await make_request_with_retry('GET', f"{base_url}/applications", headers)
-        all_applications = apps_response.json()
+        all_applications = orjson.loads(apps_response.content)
         
         # Filter applications by project environment IDs
         environment_ids = [env.get('id') for env in project_data.get('environments', [])]
@@ -1363,7 +1309,7 @@ async def bulk_deploy(app_uuids: str, force: bool = False, parallel: bool = Fals
                     response = await make_request_with_retry(
                         'POST', f"{base_url}/deploy", headers, json=payload
                     )
-                    result_data = response.json()
+                    result_data = orjson.loads(response.content)
                     
                     deployment_uuid = None
                     if 'deployments' in result_data and result_data['deployments']:
@@ -1401,7 +1347,7 @@ async def bulk_deploy(app_uuids: str, force: bool = False, parallel: bool = Fals
                     response = await make_request_with_retry(
                         'POST', f"{base_url}/deploy", headers, json=payload
                     )
-                    result_data = response.json()
+                    result_data = orjson.loads(response.content)
                     
                     deployment_uuid = None
                     if 'deployments' in result_data and result_data['deployments']:
@@ -1477,6 +1423,25 @@ APPLICATION_TOOLS = {
         "handler": list_coolify_applications
     },
     
+    "coolify-list-applications-multi": {
+        "definition": types.Tool(
+            name="coolify-list-applications-multi",
+            description="List applications for several projects in one call, grouped by project. Fetches all projects if none are given.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_uuids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Optional list of project UUIDs; defaults to every project"
+                    }
+                },
+                "additionalProperties": False
+            }
+        ),
+        "handler": list_applications_multi
+    },
+    
     "coolify-create-github-app": {
         "definition": types.Tool(
             name="coolify-create-github-app",
@@ -1656,30 +1621,6 @@ APPLICATION_TOOLS = {
         "handler": delete_application
     },
     
-    "coolify-get-application-logs": {
-        "definition": types.Tool(
-            name="coolify-get-application-logs",
-            description="Get runtime logs for an application.",
-            inputSchema={
-                "type": "object",
-                "required": ["app_uuid"],
-                "properties": {
-                    "app_uuid": {
-                        "type": "string",
-                        "description": "The UUID of the application to get logs for"
-                    },
-                    "lines": {
-                        "type": "integer",
-                        "description": "Number of recent log lines to show",
-                        "default": 100
-                    }
-                },
-                "additionalProperties": False
-            }
-        ),
-        "handler": get_application_logs
-    },
-    
     "coolify-deploy-application": {
         "definition": types.Tool(
             name="coolify-deploy-application",
@@ -1,14 +1,38 @@
 """Common utilities for Coolify API tools."""
 
+import asyncio
+import functools
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable
+
+import mcp.types as types
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 from utils.logger import setup_logger
 from utils.error_handler import handle_requests_error, format_enhanced_error
 
 # Set up logging
 logger = setup_logger("coolify_tools")
 
+@functools.lru_cache(maxsize=1)
 def get_coolify_headers():
-    """Get headers for Coolify API requests."""
+    """Get headers for Coolify API requests.
+    
+    The result is cached and shared between calls, so callers must not
+    mutate it. Use get_coolify_headers.cache_clear() after changing the token.
+    """
     api_token = os.getenv('COOLIFY_API_TOKEN')
     if not api_token:
         raise ValueError("COOLIFY_API_TOKEN environment variable not set")
@@ -18,10 +42,242 @@ def get_coolify_headers():
         'Content-Type': 'application/json'
     }
 
+@functools.lru_cache(maxsize=1)
 def get_coolify_base_url():
-    """Get the base URL for Coolify API."""
+    """Get the base URL for Coolify API (cached after the first successful call)."""
     base_url = os.getenv('COOLIFY_BASE_URL')
     if not base_url:
         raise ValueError("COOLIFY_BASE_URL environment variable not set")
     
-    return f"{base_url.rstrip('/')}/api/v1"
\ No newline at end of file
+    return f"{base_url.rstrip('/')}/api/v1"
+
+@functools.lru_cache(maxsize=256)
+def coolify_url(path: str) -> str:
+    """Get the full API URL for ``path``, built once per distinct path."""
+    return get_coolify_base_url() + path
+
+# Env var names matching this have their values masked in output
+SENSITIVE_KEY_RE = re.compile(r'token|key|secret|password', re.IGNORECASE)
+
+# Optional override for every cached_get TTL (seconds); 0 disables caching
+_ttl_env = os.getenv('COOLIFY_CACHE_TTL')
+CACHE_TTL_OVERRIDE = float(_ttl_env) if _ttl_env else None
+# Upper bound on cached paths; the oldest entry is evicted first
+CACHE_MAX_ENTRIES = 128
+
+# How long a 404/410 for a GET is replayed instead of asking Coolify again (seconds)
+NOT_FOUND_TTL = 15
+# Only single-resource poll paths have their 404s replayed
+NOT_FOUND_PATH_RE = re.compile(r'/api/v1/(?:applications|deployments)/[^/?]+$')
+
+# SQLite file for the conditional-request cache; unset (the default) disables it
+HTTP_CACHE_PATH = os.getenv('COOLIFY_HTTP_CACHE')
+
+# Methods the session adapter retries itself, and only when the request never reached
+# Coolify (a replayed DELETE would otherwise 404); callers should not add their own retries
+RETRIED_METHODS = frozenset(["GET", "PUT", "DELETE"])
+
+# Worker threads for blocking Coolify calls; matches the session pool size
+COOLIFY_MAX_WORKERS = 32
+
+_session = None
+_executor = ThreadPoolExecutor(max_workers=COOLIFY_MAX_WORKERS, thread_name_prefix="coolify")
+_cache: dict[str, tuple[float, Any]] = {}
+_inflight: dict[str, asyncio.Future] = {}
+_not_found: dict[str, tuple[float, requests.Response]] = {}
+
+def get_coolify_session() -> requests.Session:
+    """Get the shared session for Coolify API requests.
+    
+    Every tool talks to the same Coolify host, so one pooled session keeps
+    connections alive across calls instead of paying a TCP+TLS handshake
+    per request. The auth headers are set on the session once, so requests
+    sent through it need no per-call headers. Idempotent methods
+    (RETRIED_METHODS) are retried with backoff, honouring Retry-After, but
+    only when Coolify cannot have acted on the request: connection errors
+    and 429/503 replies. Read timeouts and 502/504 are not retried, since
+    the database and service start/stop/restart actions are GETs and may
+    already be running. POST and PATCH are never retried automatically.
+    
+    When COOLIFY_HTTP_CACHE is set and requests-cache is installed, GET
+    responses are also stored in that SQLite file and revalidated on every
+    use: Coolify is asked with If-None-Match / If-Modified-Since and can
+    answer 304 instead of resending the body. Nothing is served without
+    revalidation, so results are never stale. The file is plaintext, so
+    env var values, database credentials, logs and deployments (which
+    embed logs) are never written to it.
+    """
+    global _session
+    if _session is None:
+        if requests_cache is not None and HTTP_CACHE_PATH:
+            session = requests_cache.CachedSession(
+                HTTP_CACHE_PATH,
+                backend='sqlite',
+                expire_after=requests_cache.EXPIRE_IMMEDIATELY,
+                allowable_methods=('GET',),
+                urls_expire_after={
+                    '*/envs': requests_cache.DO_NOT_CACHE,
+                    '*/logs': requests_cache.DO_NOT_CACHE,
+                    '*/deployments/*': requests_cache.DO_NOT_CACHE,
+                    '*/databases': requests_cache.DO_NOT_CACHE,
+                },
+            )
+        else:
+            session = requests.Session()
+        session.headers.update(get_coolify_headers())
+        # Listings and logs are very compressible; ACCEPT_ENCODING only
+        # advertises br (and zstd) when a decoder for it is installed
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            read=0,
+            other=0,
+            status_forcelist=(429, 503),
+            allowed_methods=RETRIED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # One pooled connection per worker thread, so concurrent calls never
+        # open throwaway connections past the pool limit
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=COOLIFY_MAX_WORKERS, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session = session
+    return _session
+
+async def coolify_request(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request on the shared Coolify session without blocking the event loop.
+    
+    requests is synchronous, so the call runs on a dedicated worker pool and
+    the server can keep handling other tool calls while Coolify responds.
+    The default executor is sized from the CPU count (as few as 5 threads in
+    a small container), which would queue parallel Coolify calls behind each
+    other and behind unrelated to_thread work.
+    
+    Agents often poll application and deployment UUIDs that do not exist
+    (yet), so a 404/410 for a GET on /applications/{uuid} or
+    /deployments/{uuid} is remembered for NOT_FOUND_TTL seconds and
+    replayed. Any other method sent from this process may create the
+    missing resource or change application state, so once it completes it
+    clears those entries and the cached application listing. Resources
+    created elsewhere (the Coolify UI, a webhook, another worker) stay
+    hidden until the entry expires or invalidate_cache() is called.
+    """
+    if method == "GET":
+        entry = _not_found.get(url)
+        if entry is not None and time.monotonic() - entry[0] < NOT_FOUND_TTL:
+            return entry[1]
+    
+    loop = asyncio.get_running_loop()
+    call = functools.partial(get_coolify_session().request, method, url, **kwargs)
+    try:
+        response = await loop.run_in_executor(_executor, call)
+    finally:
+        if method != "GET":
+            _not_found.clear()
+            invalidate_cache("/applications")
+    
+    if (method == "GET" and response.status_code in (404, 410) and "params" not in kwargs
+            and NOT_FOUND_PATH_RE.search(url)):
+        if len(_not_found) >= CACHE_MAX_ENTRIES:
+            _not_found.clear()
+        _not_found[url] = (time.monotonic(), response)
+    return response
+
+async def cached_get(path: str, ttl: float) -> Any:
+    """GET a Coolify API path, reusing the parsed body for ``ttl`` seconds.
+    
+    Meant for parameterless listings (version, projects, servers) that
+    agents tend to request several times in a row. Plain-text bodies are
+    returned as stripped strings. COOLIFY_CACHE_TTL overrides ``ttl``.
+    """
+    if CACHE_TTL_OVERRIDE is not None:
+        ttl = CACHE_TTL_OVERRIDE
+    entry = _cache.get(path)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return await coalesce(path, lambda: _fetch_and_cache(path))
+
+async def _fetch_and_cache(path: str) -> Any:
+    response = await coolify_request("GET", coolify_url(path), timeout=30)
+    response.raise_for_status()
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        data = response.text.strip()
+    
+    _cache.pop(path, None)
+    if len(_cache) >= CACHE_MAX_ENTRIES:
+        del _cache[next(iter(_cache))]
+    _cache[path] = (time.monotonic(), data)
+    return data
+
+def invalidate_cache(*paths: str) -> int:
+    """Drop cached entries for the given API paths, or everything if none are given.
+    
+    Clearing everything also forgets the remembered 404s.
+    """
+    if not paths:
+        count = len(_cache) + len(_not_found)
+        _cache.clear()
+        _not_found.clear()
+        return count
+    return sum(_cache.pop(path, None) is not None for path in paths)
+
+async def coalesce(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``fetch`` once for all concurrent callers that share ``key``.
+    
+    While a fetch is pending, duplicate calls await the same task instead of
+    sending their own request. Each waiter is shielded so a cancelled caller
+    does not cancel the fetch for the others.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+def close_coolify_session():
+    """Close the shared Coolify session and release its pooled connections."""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+    get_coolify_headers.cache_clear()
+
+def coolify_tool(action: str, doing: str, key: str = "app_uuid"):
+    """Wrap a tool handler with the shared Coolify error replies.
+    
+    HTTP errors become "❌ Failed to {action}: HTTP Error ..." and anything
+    else "❌ Error {doing}: ...", both logged with the handler's ``key``
+    argument (or its first positional argument) as the target.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await handler(*args, **kwargs)
+            except requests.exceptions.HTTPError as e:
+                target = kwargs.get(key, args[0] if args else "")
+                error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
+                logger.error(f"Failed to {action} {target}: {error_msg}")
+                return [types.TextContent(type="text", text=f"❌ Failed to {action}: {error_msg}")]
+            except Exception as e:
+                target = kwargs.get(key, args[0] if args else "")
+                logger.error(f"Failed to {action} {target}: {e}")
+                return [types.TextContent(type="text", text=f"❌ Error {doing}: {e}")]
+        return wrapper
+    return decorator
+
+def reset_coolify_config():
+    """Forget cached Coolify settings and responses.
+    
+    Call after changing COOLIFY_BASE_URL or COOLIFY_API_TOKEN at runtime (for
+    example in tests) so the next request reads the environment again.
+    """
+    close_coolify_session()
+    get_coolify_base_url.cache_clear()
+    coolify_url.cache_clear()
+    invalidate_cache()
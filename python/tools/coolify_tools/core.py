@@ -1,11 +1,12 @@
 """Core Coolify API tools - version, projects, servers, and deployment info."""
 
+import asyncio
 import os
 import mcp.types as types
 import requests
 from utils.logger import setup_logger
 from utils.error_handler import handle_requests_error, format_enhanced_error
-from .base import get_coolify_headers, get_coolify_base_url
+from .base import cached_get, invalidate_cache
 
 # Set up logging
 logger = setup_logger("coolify_core")
@@ -15,17 +16,8 @@ logger = setup_logger("coolify_core")
 async def get_coolify_version() -> list[types.TextContent]:
     """Get Coolify version information."""
     try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.get(f"{base_url}/version", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        # Handle both JSON and plain text responses
-        try:
-            result = response.json()
-        except:
-            result = response.text.strip()
+        # The version only changes on upgrade, so it can be cached for a while
+        result = await cached_get("/version", ttl=300)
         
         logger.info("Successfully retrieved Coolify version")
         return [types.TextContent(type="text", text=f"Coolify Version: {result}")]
@@ -42,13 +34,7 @@ async def get_coolify_version() -> list[types.TextContent]:
 async def list_coolify_projects() -> list[types.TextContent]:
     """List all projects in Coolify."""
     try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.get(f"{base_url}/projects", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        projects = response.json()
+        projects = await cached_get("/projects", ttl=10)
         logger.info(f"Successfully retrieved {len(projects)} projects")
         
         if isinstance(projects, list):
@@ -77,13 +63,7 @@ async def list_coolify_projects() -> list[types.TextContent]:
 async def list_coolify_servers() -> list[types.TextContent]:
     """List all servers in Coolify."""
     try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.get(f"{base_url}/servers", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        servers = response.json()
+        servers = await cached_get("/servers", ttl=10)
         logger.info(f"Successfully retrieved servers")
         
         if isinstance(servers, list):
@@ -104,30 +84,40 @@ async def list_coolify_servers() -> list[types.TextContent]:
             
         return [types.TextContent(type="text", text=result)]
         
+    except requests.RequestException as e:
+        logger.error(f"Failed to list Coolify servers: {e}")
+        error_msg = handle_requests_error(e, "Unable to retrieve servers from Coolify API", "coolify-list-servers")
+        return [types.TextContent(type="text", text=error_msg)]
     except Exception as e:
         logger.error(f"Failed to list Coolify servers: {e}")
         return [types.TextContent(type="text", text=f"Error listing servers: {e}")]
 
+# Static footer for get_deployment_info
+DEPLOYMENT_USAGE = (
+    "\n💡 **Usage:**\n"
+    "• Create GitHub App: `coolify-create-github-app --project_uuid PROJECT_UUID --server_uuid SERVER_UUID --git_repository REPO_URL --name APP_NAME`\n"
+    "• List applications: `coolify-list-applications`\n"
+    "• Deploy app: `coolify-deploy-application --app_uuid APP_UUID`\n"
+)
+
 async def get_deployment_info() -> list[types.TextContent]:
     """Get the correct server UUID and project information for deployments."""
     try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        # Get projects and servers
-        projects_response = requests.get(f"{base_url}/projects", headers=headers, timeout=30)
-        servers_response = requests.get(f"{base_url}/servers", headers=headers, timeout=30)
-        
-        projects_response.raise_for_status()
-        servers_response.raise_for_status()
-        
-        projects = projects_response.json()
-        servers = servers_response.json()
-        
-        result = "🚀 Coolify Deployment Information\n\n"
+        # Get projects and servers; the two lookups are independent
+        projects, servers = await asyncio.gather(
+            cached_get("/projects", ttl=10),
+            cached_get("/servers", ttl=10),
+            return_exceptions=True,
+        )
+        for lookup in (projects, servers):
+            if isinstance(lookup, Exception):
+                raise lookup
+        
+        parts = ["🚀 Coolify Deployment Information\n\n"]
+        append = parts.append
         
         # Server info with correct UUID
-        result += "📡 **Server Information**:\n"
+        append("📡 **Server Information**:\n")
         if isinstance(servers, list) and servers:
             main_server = servers[0]  # Usually the first/main server
             server_uuid = main_server.get('uuid', 'N/A')
@@ -135,23 +125,20 @@ async def get_deployment_info() -> list[types.TextContent]:
             server_ip = main_server.get('ip', 'N/A')
             is_usable = main_server.get('is_usable', False)
             
-            result += f"• Server UUID: `{server_uuid}` ✅\n"
-            result += f"• Name: {server_name} ({server_ip})\n"
-            result += f"• Status: {'✅ Usable' if is_usable else '❌ Not usable'}\n\n"
+            append(f"• Server UUID: `{server_uuid}` ✅\n")
+            append(f"• Name: {server_name} ({server_ip})\n")
+            append(f"• Status: {'✅ Usable' if is_usable else '❌ Not usable'}\n\n")
         
         # Project info
-        result += "📁 **Available Projects**:\n"
+        append("📁 **Available Projects**:\n")
         if isinstance(projects, list):
-            for project in projects:
-                name = project.get('name', 'N/A')
-                uuid = project.get('uuid', 'N/A')
-                description = project.get('description', 'No description')
-                result += f"• **{name}** (UUID: `{uuid}`): {description}\n"
+            parts.extend(
+                f"• **{project.get('name', 'N/A')}** (UUID: `{project.get('uuid', 'N/A')}`): {project.get('description', 'No description')}\n"
+                for project in projects
+            )
         
-        result += "\n💡 **Usage:**\n"
-        result += "• Create GitHub App: `coolify-create-github-app --project_uuid PROJECT_UUID --server_uuid SERVER_UUID --git_repository REPO_URL --name APP_NAME`\n"
-        result += "• List applications: `coolify-list-applications`\n"
-        result += "• Deploy app: `coolify-deploy-application --app_uuid APP_UUID`\n"
+        append(DEPLOYMENT_USAGE)
+        result = "".join(parts)
         
         logger.info("Successfully retrieved deployment information")
         return [types.TextContent(type="text", text=result)]
@@ -161,6 +148,13 @@ async def get_deployment_info() -> list[types.TextContent]:
         error_msg = handle_requests_error(e, "Unable to retrieve deployment information", "coolify-get-deployment-info")
         return [types.TextContent(type="text", text=error_msg)]
 
+async def invalidate_coolify_cache(path: str = None) -> list[types.TextContent]:
+    """Drop cached Coolify listings so the next call fetches fresh data."""
+    removed = invalidate_cache(path) if path else invalidate_cache()
+    target = f"`{path}`" if path else "all entries"
+    logger.info(f"Invalidated Coolify cache for {target} ({removed} removed)")
+    return [types.TextContent(type="text", text=f"🧹 Cleared Coolify cache for {target} ({removed} entries removed)")]
+
 # Core Tools Registry
 CORE_TOOLS = {
     "coolify-get-version": {
@@ -213,5 +207,23 @@ CORE_TOOLS = {
             }
         ),
         "handler": get_deployment_info
+    },
+    
+    "coolify-cache-invalidate": {
+        "definition": types.Tool(
+            name="coolify-cache-invalidate",
+            description="Clear cached Coolify listings (version, projects, servers, applications) and remembered 404s so the next call hits the API.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "API path to invalidate, e.g. '/projects'. Omit to clear everything."
+                    }
+                },
+                "additionalProperties": False
+            }
+        ),
+        "handler": invalidate_coolify_cache
     }
 }
\ No newline at end of file
@@ -2,10 +2,11 @@
 
 import os
 import mcp.types as types
+import orjson
 import requests
 from utils.logger import setup_logger
 from utils.error_handler import handle_requests_error, format_enhanced_error, get_resource_not_found_message
-from .base import get_coolify_headers, get_coolify_base_url
+from .base import get_coolify_headers, get_coolify_base_url, coolify_request
 
 # Set up logging
 logger = setup_logger("coolify_tools.databases")
@@ -18,10 +19,10 @@ async def list_coolify_databases() -> list[types.TextContent]:
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/databases", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/databases", headers=headers, timeout=30)
         response.raise_for_status()
         
-        databases = response.json()
+        databases = orjson.loads(response.content)
         
         if not databases:
             return [types.TextContent(type="text", text="✅ No databases found in Coolify.")]
@@ -102,10 +103,10 @@ async def get_coolify_database_by_uuid(database_uuid: str = None) -> list[types.
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/databases/{database_uuid}", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/databases/{database_uuid}", headers=headers, timeout=30)
         response.raise_for_status()
         
-        db_data = response.json()
+        db_data = orjson.loads(response.content)
         
         name = db_data.get('name', 'N/A')
         db_type = db_data.get('type', 'N/A')
@@ -287,10 +288,10 @@ coolify-create-database --database_type postgresql --name myapp-db --server_uuid
             if postgres_password:  # Reuse for mongo_initdb_root_password
                 payload["mongo_initdb_root_password"] = postgres_password
         
-        response = requests.post(f"{base_url}/{endpoint}", headers=headers, json=payload, timeout=30)
+        response = await coolify_request("POST", f"{base_url}/{endpoint}", headers=headers, json=payload, timeout=30)
         response.raise_for_status()
         
-        result_data = response.json()
+        result_data = orjson.loads(response.content)
         
         result = f"""✅ **Database Created Successfully!**
 
@@ -320,7 +321,7 @@ async def start_coolify_database(database_uuid: str) -> list[types.TextContent]:
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/databases/{database_uuid}/start", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/databases/{database_uuid}/start", headers=headers, timeout=30)
         response.raise_for_status()
         
         result = f"""✅ **Database Started Successfully!**
@@ -346,7 +347,7 @@ async def stop_coolify_database(database_uuid: str) -> list[types.TextContent]:
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/databases/{database_uuid}/stop", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/databases/{database_uuid}/stop", headers=headers, timeout=30)
         response.raise_for_status()
         
         result = f"""✅ **Database Stopped Successfully!**
@@ -372,7 +373,7 @@ async def restart_coolify_database(database_uuid: str) -> list[types.TextContent
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/databases/{database_uuid}/restart", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/databases/{database_uuid}/restart", headers=headers, timeout=30)
         response.raise_for_status()
         
         result = f"""✅ **Database Restarted Successfully!**
@@ -401,7 +402,7 @@ async def delete_coolify_database(database_uuid: str, confirm: bool = False) ->
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.delete(f"{base_url}/databases/{database_uuid}", headers=headers, timeout=30)
+        response = await coolify_request("DELETE", f"{base_url}/databases/{database_uuid}", headers=headers, timeout=30)
         response.raise_for_status()
         
         result = f"""✅ **Database Deleted Successfully!**
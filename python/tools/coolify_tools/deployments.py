@@ -1,20 +1,38 @@
 """Deployment and monitoring tools for Coolify API."""
 
+import asyncio
+import re
+import orjson
 import requests
 import mcp.types as types
-from .base import get_coolify_headers, get_coolify_base_url, logger
+from .base import get_coolify_headers, get_coolify_base_url, coolify_url, coolify_request, coalesce, logger
 from utils.error_handler import handle_requests_error, format_enhanced_error
 
+# How long a deployment lookup waits for duplicate polls to join it (seconds)
+DEPLOYMENT_POLL_WINDOW = 0.05
+
+# Hidden log entries are still shown when they match this
+ERROR_KEYWORDS_RE = re.compile(r'error|fail|exception|unhealthy', re.IGNORECASE)
+
+async def _fetch_deployment(deployment_uuid: str) -> dict:
+    """Fetch a deployment, batching polls of the same UUID into one request.
+    
+    Agents tend to poll the same deployment several times a second. The
+    first caller opens a short window; every caller that arrives before the
+    request goes out shares its result and applies its own formatting.
+    """
+    async def fetch():
+        await asyncio.sleep(DEPLOYMENT_POLL_WINDOW)
+        response = await coolify_request("GET", coolify_url(f"/deployments/{deployment_uuid}"), timeout=30)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    return await coalesce(f"/deployments/{deployment_uuid}", fetch)
+
 async def get_deployment_logs(deployment_uuid: str, lines: int = 50) -> list[types.TextContent]:
     """Get deployment logs and status for a specific deployment UUID."""
     try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.get(f"{base_url}/deployments/{deployment_uuid}", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        deployment_data = response.json()
+        deployment_data = await _fetch_deployment(deployment_uuid)
         logger.info(f"Successfully retrieved deployment data for {deployment_uuid}")
         
         # Extract basic deployment info
@@ -62,10 +80,9 @@ Finished: {finished_at}
         
         # Process smaller logs normally
         if isinstance(logs_data, str):
-            import json
             try:
-                logs_data = json.loads(logs_data)
-            except:
+                logs_data = orjson.loads(logs_data)
+            except orjson.JSONDecodeError:
                 result += f"**📋 Deployment Logs:**\n\n{logs_data}"
                 return [types.TextContent(type="text", text=result)]
         
@@ -75,6 +92,9 @@ Finished: {finished_at}
             # Get the last N lines
             recent_logs = logs_data[-lines:] if lines > 0 else logs_data[-20:]
             
+            # Collect pieces and join once; repeated += is quadratic on long logs
+            parts = [result]
+            append = parts.append
             for log_entry in recent_logs:
                 if isinstance(log_entry, dict):
                     output = log_entry.get('output', '')
@@ -82,13 +102,14 @@ Finished: {finished_at}
                     hidden = log_entry.get('hidden', False)
                     
                     # Skip hidden logs unless they contain important error info
-                    if hidden and not any(keyword in output.lower() for keyword in ['error', 'fail', 'exception', 'unhealthy']):
+                    if hidden and not ERROR_KEYWORDS_RE.search(output):
                         continue
                     
                     if output.strip():
-                        result += f"**{log_type.upper()}:** {output}\n\n"
+                        append(f"**{log_type.upper()}:** {output}\n\n")
                 else:
-                    result += f"**LOG:** {log_entry}\n\n"
+                    append(f"**LOG:** {log_entry}\n\n")
+            result = "".join(parts)
         else:
             result += f"**📋 Deployment Logs:**\n\n{logs_data}"
         
@@ -105,13 +126,7 @@ Finished: {finished_at}
 async def watch_deployment(deployment_uuid: str, show_progress: bool = True) -> list[types.TextContent]:
     """Get real-time deployment progress and status."""
     try:
-        base_url = get_coolify_base_url()
-        headers = get_coolify_headers()
-        
-        response = requests.get(f"{base_url}/deployments/{deployment_uuid}", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        deployment_data = response.json()
+        deployment_data = await _fetch_deployment(deployment_uuid)
         logger.info(f"Successfully retrieved deployment status for {deployment_uuid}")
         
         # Extract deployment information
@@ -173,10 +188,10 @@ async def get_recent_deployments(app_uuid: str, limit: int = 5) -> list[types.Te
         headers = get_coolify_headers()
         
         # Use the specific endpoint for application deployments
-        response = requests.get(f"{base_url}/deployments/list-by-app-uuid?uuid={app_uuid}", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/deployments/list-by-app-uuid?uuid={app_uuid}", headers=headers, timeout=30)
         response.raise_for_status()
         
-        app_deployments = response.json()
+        app_deployments = orjson.loads(response.content)
         logger.info(f"Successfully retrieved deployments for application {app_uuid}")
         
         # Ensure we have a list
@@ -190,7 +205,8 @@ async def get_recent_deployments(app_uuid: str, limit: int = 5) -> list[types.Te
         sorted_deployments = sorted(app_deployments, key=lambda x: x.get('created_at', ''), reverse=True)
         recent_deployments = sorted_deployments[:limit]
         
-        result = f"📋 **Recent Deployments for Application {app_uuid}**\n\n"
+        parts = [f"📋 **Recent Deployments for Application {app_uuid}**\n\n"]
+        append = parts.append
         
         for i, deployment in enumerate(recent_deployments, 1):
             # Try different possible UUID field names
@@ -215,29 +231,29 @@ async def get_recent_deployments(app_uuid: str, limit: int = 5) -> list[types.Te
             
             uuid_display = deployment_uuid[:8] + "..." if len(str(deployment_uuid)) > 8 else str(deployment_uuid)
             
-            result += f"""{i}. {status_emoji} **Deployment {uuid_display}**
+            append(f"""{i}. {status_emoji} **Deployment {uuid_display}**
    UUID: {deployment_uuid}
    Status: {status}
    Started: {created_at}
    Finished: {finished_at}
    
-"""
+""")
         
-        result += f"""
+        append(f"""
 💡 **Commands:**
 • View logs: `coolify-get-deployment-logs --deployment_uuid DEPLOYMENT_UUID`
 • Watch deployment: `coolify-watch-deployment --deployment_uuid DEPLOYMENT_UUID`
 
-🔍 **Available Deployment UUIDs:**"""
+🔍 **Available Deployment UUIDs:**""")
 
         for deployment in recent_deployments:
             deployment_uuid = (deployment.get('deployment_uuid') or 
                              deployment.get('uuid') or 
                              deployment.get('id') or 
                              'N/A')
-            result += f"\n• {deployment_uuid}"
+            append(f"\n• {deployment_uuid}")
         
-        return [types.TextContent(type="text", text=result)]
+        return [types.TextContent(type="text", text="".join(parts))]
         
     except requests.exceptions.HTTPError as e:
         logger.error(f"Failed to get recent deployments for {app_uuid}: {e}")
@@ -254,10 +270,10 @@ async def deployment_metrics(app_uuid: str, days: int = 30) -> list[types.TextCo
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/deployments/by-app-uuid?uuid={app_uuid}", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/deployments/by-app-uuid?uuid={app_uuid}", headers=headers, timeout=30)
         response.raise_for_status()
         
-        deployments = response.json()
+        deployments = orjson.loads(response.content)
         logger.info(f"Successfully retrieved deployment metrics for application {app_uuid}")
         
         if not deployments or len(deployments) == 0:
@@ -276,7 +292,7 @@ async def deployment_metrics(app_uuid: str, days: int = 30) -> list[types.TextCo
                         deployment_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
                         if deployment_date >= cutoff_date:
                             recent_deployments.append(deployment)
-                    except:
+                    except (ValueError, TypeError):
                         # Include if we can't parse date
                         recent_deployments.append(deployment)
                 else:
@@ -328,7 +344,7 @@ async def deployment_metrics(app_uuid: str, days: int = 30) -> list[types.TextCo
                     finish = datetime.fromisoformat(finished_at.replace('Z', '+00:00'))
                     duration = (finish - start).total_seconds()
                     durations.append(duration)
-                except:
+                except (ValueError, TypeError):
                     continue
         
         if durations:
@@ -367,10 +383,10 @@ async def get_application_logs(app_uuid: str, lines: int = 100) -> list[types.Te
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/applications/{app_uuid}/logs?lines={lines}", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/applications/{app_uuid}/logs?lines={lines}", headers=headers, timeout=30)
         response.raise_for_status()
         
-        logs_data = response.json()
+        logs_data = orjson.loads(response.content)
         logger.info(f"Successfully retrieved application logs for {app_uuid}")
         
         result = f"📋 **Application Logs for {app_uuid}**\n\n"
@@ -382,6 +398,8 @@ async def get_application_logs(app_uuid: str, lines: int = 100) -> list[types.Te
             logs = logs_data
         
         if isinstance(logs, list):
+            parts = [result]
+            append = parts.append
             for log_entry in logs[-lines:]:
                 if isinstance(log_entry, dict):
                     timestamp = log_entry.get('timestamp', '')
@@ -389,11 +407,12 @@ async def get_application_logs(app_uuid: str, lines: int = 100) -> list[types.Te
                     level = log_entry.get('level', log_entry.get('type', 'INFO'))
                     
                     if timestamp:
-                        result += f"[{timestamp}] {level}: {message}\n"
+                        append(f"[{timestamp}] {level}: {message}\n")
                     else:
-                        result += f"{level}: {message}\n"
+                        append(f"{level}: {message}\n")
                 else:
-                    result += f"LOG: {log_entry}\n"
+                    append(f"LOG: {log_entry}\n")
+            result = "".join(parts)
         elif isinstance(logs, str):
             # If logs are returned as a single string
             result += logs
@@ -417,10 +436,10 @@ async def debug_deployments_api() -> list[types.TextContent]:
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/deployments", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/deployments", headers=headers, timeout=30)
         response.raise_for_status()
         
-        deployments = response.json()
+        deployments = orjson.loads(response.content)
         
         # Show first few deployments with full structure
         import json
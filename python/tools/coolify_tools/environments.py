@@ -1,34 +1,26 @@
 """Environment variable management tools for Coolify API."""
 
+import orjson
 import requests
 import mcp.types as types
-from .base import get_coolify_headers, get_coolify_base_url, logger
+from .base import get_coolify_headers, get_coolify_base_url, coolify_request, logger, SENSITIVE_KEY_RE
 from utils.error_handler import handle_requests_error, format_enhanced_error
 
-async def make_request_with_retry(method, url, headers, json=None, retries=2):
-    """Make HTTP request with retry logic."""
-    for attempt in range(retries + 1):
-        try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, timeout=30)
-            elif method.upper() == 'POST':
-                response = requests.post(url, headers=headers, json=json, timeout=30)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, headers=headers, json=json, timeout=30)
-            elif method.upper() == 'PATCH':
-                response = requests.patch(url, headers=headers, json=json, timeout=30)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=30)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException as e:
-            if attempt == retries:
-                raise e
-            logger.warning(f"Request attempt {attempt + 1} failed, retrying...")
+async def make_request_with_retry(method, url, headers, json=None):
+    """Make one HTTP request and raise for error statuses.
     
+    Retries are left to the session adapter, which only repeats requests
+    Coolify cannot have acted on, so an env var create or update that
+    failed or timed out is never sent twice.
+    """
+    method = method.upper()
+    if method not in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    response = await coolify_request(method, url, headers=headers, json=json, timeout=30)
+    response.raise_for_status()
+    return response
+
 async def set_env_variable(app_uuid: str, key: str, value: str, is_preview: bool = False) -> list[types.TextContent]:
     """Add or update an environment variable for an application."""
     try:
@@ -38,7 +30,7 @@ async def set_env_variable(app_uuid: str, key: str, value: str, is_preview: bool
         # First, check if the variable already exists
         try:
             env_response = await make_request_with_retry('GET', f"{base_url}/applications/{app_uuid}/envs", headers)
-            existing_vars = env_response.json()
+            existing_vars = orjson.loads(env_response.content)
             
             # Find existing variable
             existing_var = None
@@ -92,7 +84,7 @@ async def set_env_variable(app_uuid: str, key: str, value: str, is_preview: bool
         
         env_type = "Preview" if is_preview else "Production"
         # Mask sensitive values in output
-        display_value = "***MASKED***" if any(sensitive in key.lower() for sensitive in ['token', 'key', 'secret', 'password', 'api']) else value[:50] + ("..." if len(value) > 50 else "")
+        display_value = "***MASKED***" if (SENSITIVE_KEY_RE.search(key) or 'api' in key.lower()) else value[:50] + ("..." if len(value) > 50 else "")
         
         result = f"✅ Environment variable **{key}** set successfully!\n\n"
         result += f"**Variable Details:**\n"
@@ -119,7 +111,7 @@ async def delete_env_variable(app_uuid: str, key: str, is_preview: bool = False)
         
         # First, get all environment variables to find the one to delete
         env_response = await make_request_with_retry('GET', f"{base_url}/applications/{app_uuid}/envs", headers)
-        env_vars = env_response.json()
+        env_vars = orjson.loads(env_response.content)
         
         # Find the environment variable to delete
         env_to_delete = None
@@ -186,7 +178,7 @@ async def bulk_update_env(app_uuid: str, env_vars: str, is_preview: bool = False
         # Get existing variables once for efficiency
         try:
             env_response = await make_request_with_retry('GET', f"{base_url}/applications/{app_uuid}/envs", headers)
-            existing_vars = env_response.json() if env_response else []
+            existing_vars = orjson.loads(env_response.content) if env_response else []
         except Exception:
             existing_vars = []
         
@@ -8,26 +8,24 @@ from .deployments import DEPLOYMENT_TOOLS
 from .environments import ENVIRONMENT_TOOLS
 from .sse_deployment_tools import SSE_DEPLOYMENT_TOOLS
 
+# All Coolify tools, merged once at import time
+COOLIFY_TOOLS = {
+    # Core tools (version, projects, servers, deployment info)
+    **CORE_TOOLS,
+    # Application tools
+    **APPLICATION_TOOLS,
+    # Database tools
+    **DATABASE_TOOLS,
+    # Service tools
+    **SERVICE_TOOLS,
+    # Deployment tools
+    **DEPLOYMENT_TOOLS,
+    # Environment variable tools
+    **ENVIRONMENT_TOOLS,
+    # SSE deployment monitoring tools
+    **SSE_DEPLOYMENT_TOOLS,
+}
+
 def register_coolify_tools(tool_registry):
     """Register all Coolify API tools with the tool registry."""
-    
-    # Register core tools (version, projects, servers, deployment info)
-    tool_registry.update(CORE_TOOLS)
-    
-    # Register application tools
-    tool_registry.update(APPLICATION_TOOLS)
-    
-    # Register database tools
-    tool_registry.update(DATABASE_TOOLS)
-    
-    # Register service tools
-    tool_registry.update(SERVICE_TOOLS)
-    
-    # Register deployment tools
-    tool_registry.update(DEPLOYMENT_TOOLS)
-    
-    # Register environment variable tools
-    tool_registry.update(ENVIRONMENT_TOOLS)
-    
-    # Register SSE deployment monitoring tools
-    tool_registry.update(SSE_DEPLOYMENT_TOOLS)
\ No newline at end of file
+    tool_registry.update(COOLIFY_TOOLS)
@@ -2,10 +2,11 @@
 
 import os
 import mcp.types as types
+import orjson
 import requests
 from utils.logger import setup_logger
 from utils.error_handler import handle_requests_error, format_enhanced_error, get_resource_not_found_message
-from .base import get_coolify_headers, get_coolify_base_url
+from .base import get_coolify_headers, get_coolify_base_url, coolify_request, SENSITIVE_KEY_RE
 
 # Set up logging
 logger = setup_logger("coolify_services")
@@ -18,10 +19,10 @@ async def list_coolify_services() -> list[types.TextContent]:
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/services", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/services", headers=headers, timeout=30)
         response.raise_for_status()
         
-        services = response.json()
+        services = orjson.loads(response.content)
         
         if not services:
             return [types.TextContent(type="text", text="✅ No services found in Coolify.")]
@@ -61,10 +62,10 @@ async def get_coolify_service_by_uuid(service_uuid: str) -> list[types.TextConte
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/services/{service_uuid}", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/services/{service_uuid}", headers=headers, timeout=30)
         response.raise_for_status()
         
-        service_data = response.json()
+        service_data = orjson.loads(response.content)
         
         name = service_data.get('name', 'N/A')
         service_type = service_data.get('type', 'N/A')
@@ -188,10 +189,10 @@ coolify-create-service --name custom-app --type custom --docker_compose_raw "ver
         if docker_compose_raw:
             payload["docker_compose_raw"] = docker_compose_raw
         
-        response = requests.post(f"{base_url}/services", headers=headers, json=payload, timeout=30)
+        response = await coolify_request("POST", f"{base_url}/services", headers=headers, json=payload, timeout=30)
         response.raise_for_status()
         
-        result_data = response.json()
+        result_data = orjson.loads(response.content)
         
         # Extract UUID and domains from response
         service_uuid = result_data.get('uuid', 'N/A')
@@ -228,7 +229,7 @@ async def start_coolify_service(service_uuid: str) -> list[types.TextContent]:
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/services/{service_uuid}/start", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/services/{service_uuid}/start", headers=headers, timeout=30)
         response.raise_for_status()
         
         result = f"""✅ **Service Started Successfully!**
@@ -254,7 +255,7 @@ async def stop_coolify_service(service_uuid: str) -> list[types.TextContent]:
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/services/{service_uuid}/stop", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/services/{service_uuid}/stop", headers=headers, timeout=30)
         response.raise_for_status()
         
         result = f"""✅ **Service Stopped Successfully!**
@@ -280,7 +281,7 @@ async def restart_coolify_service(service_uuid: str) -> list[types.TextContent]:
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.get(f"{base_url}/services/{service_uuid}/restart", headers=headers, timeout=30)
+        response = await coolify_request("GET", f"{base_url}/services/{service_uuid}/restart", headers=headers, timeout=30)
         response.raise_for_status()
         
         result = f"""✅ **Service Restarted Successfully!**
@@ -309,7 +310,7 @@ async def delete_coolify_service(service_uuid: str, confirm: bool = False) -> li
         base_url = get_coolify_base_url()
         headers = get_coolify_headers()
         
-        response = requests.delete(f"{base_url}/services/{service_uuid}", headers=headers, timeout=30)
+        response = await coolify_request("DELETE", f"{base_url}/services/{service_uuid}", headers=headers, timeout=30)
         response.raise_for_status()
         
         result = f"""✅ **Service Deleted Successfully!**
@@ -335,10 +336,10 @@ async def manage_coolify_service_env(service_uuid: str, action: str, key: str =
         headers = get_coolify_headers()
         
         if action == "list":
-            response = requests.get(f"{base_url}/services/{service_uuid}/envs", headers=headers, timeout=30)
+            response = await coolify_request("GET", f"{base_url}/services/{service_uuid}/envs", headers=headers, timeout=30)
             response.raise_for_status()
             
-            env_vars = response.json()
+            env_vars = orjson.loads(response.content)
             
             if not env_vars:
                 return [types.TextContent(type="text", text=f"✅ No environment variables found for service {service_uuid}.")]
@@ -350,7 +351,7 @@ async def manage_coolify_service_env(service_uuid: str, action: str, key: str =
                 env_value = env_var.get('value', 'N/A')
                 
                 # Mask sensitive values
-                if any(sensitive in env_key.lower() for sensitive in ['token', 'key', 'secret', 'password']):
+                if SENSITIVE_KEY_RE.search(env_key):
                     env_value = '***MASKED***'
                 
                 result += f"**{env_key}:** {env_value}\n"
@@ -369,9 +370,9 @@ async def manage_coolify_service_env(service_uuid: str, action: str, key: str =
             payload = {"key": key, "value": value}
             
             if action == "create":
-                response = requests.post(f"{base_url}/services/{service_uuid}/envs", headers=headers, json=payload, timeout=30)
+                response = await coolify_request("POST", f"{base_url}/services/{service_uuid}/envs", headers=headers, json=payload, timeout=30)
             else:  # update
-                response = requests.patch(f"{base_url}/services/{service_uuid}/envs", headers=headers, json=payload, timeout=30)
+                response = await coolify_request("PATCH", f"{base_url}/services/{service_uuid}/envs", headers=headers, json=payload, timeout=30)
             
             response.raise_for_status()
             
@@ -379,7 +380,7 @@ async def manage_coolify_service_env(service_uuid: str, action: str, key: str =
 
 Service UUID: {service_uuid}
 Key: {key}
-Value: {'***MASKED***' if any(sensitive in key.lower() for sensitive in ['token', 'key', 'secret', 'password']) else value}
+Value: {'***MASKED***' if SENSITIVE_KEY_RE.search(key) else value}
 
 💡 **Next Steps:**
 • List all vars: `coolify-manage-service-env --service_uuid {service_uuid} --action list`
@@ -392,7 +393,7 @@ Value: {'***MASKED***' if any(sensitive in key.lower() for sensitive in ['token'
             if not key:
                 return [types.TextContent(type="text", text="❌ 'key' is required for delete action.")]
             
-            response = requests.delete(f"{base_url}/services/{service_uuid}/envs/{key}", headers=headers, timeout=30)
+            response = await coolify_request("DELETE", f"{base_url}/services/{service_uuid}/envs/{key}", headers=headers, timeout=30)
             response.raise_for_status()
             
             result = f"""✅ **Environment Variable Deleted Successfully!**
@@ -6,8 +6,8 @@ import time
 import logging
 from typing import Dict, Any, Optional, AsyncGenerator
 from datetime import datetime
-import requests
-from .base import get_coolify_headers, get_coolify_base_url, logger
+import orjson
+from .base import get_coolify_headers, get_coolify_base_url, coolify_request, logger
 
 class DeploymentMonitor:
     """Real-time deployment monitoring with SSE support."""
@@ -27,10 +27,10 @@ class DeploymentMonitor:
             if force:
                 payload["force"] = True
             
-            response = requests.post(f"{base_url}/deploy", json=payload, headers=headers, timeout=30)
+            response = await coolify_request("POST", f"{base_url}/deploy", json=payload, headers=headers, timeout=30)
             response.raise_for_status()
             
-            deployment_data = response.json()
+            deployment_data = orjson.loads(response.content)
             deployment_uuid = None
             
             # Parse deployment UUID from response structure (same as working deploy_application)
@@ -130,10 +130,10 @@ class DeploymentMonitor:
             base_url = get_coolify_base_url()
             headers = get_coolify_headers()
             
-            response = requests.get(f"{base_url}/deployments/{deployment_uuid}", headers=headers, timeout=10)
+            response = await coolify_request("GET", f"{base_url}/deployments/{deployment_uuid}", headers=headers, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             return {
                 'status': data.get('status', 'unknown'),
@@ -1,8 +1,11 @@
 """Simple web scraping tools for the MCP server."""
 
+import asyncio
+
 import mcp.types as types
 import requests
 from bs4 import BeautifulSoup
+from utils.http import get_http_session
 from utils.logger import setup_logger
 from utils.error_handler import handle_requests_error, format_enhanced_error
 
@@ -75,7 +78,9 @@ async def crawl_url_with_options(
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = await asyncio.to_thread(
+            get_http_session().get, url, headers=headers, timeout=timeout
+        )
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'html.parser')
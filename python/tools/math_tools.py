@@ -31,7 +31,8 @@ def register_math_tools(tool_registry):
                 }
             }
         ),
-        "handler": add_numbers
+        "handler": add_numbers,
+        "cacheable": True
     }
 
     tool_registry["multiply-numbers"] = {
@@ -53,7 +54,8 @@ def register_math_tools(tool_registry):
                 }
             }
         ),
-        "handler": multiply_numbers
+        "handler": multiply_numbers,
+        "cacheable": True
     }
 
     tool_registry["calculate-percentage"] = {
@@ -75,7 +77,8 @@ def register_math_tools(tool_registry):
                 }
             }
         ),
-        "handler": calculate_percentage
+        "handler": calculate_percentage,
+        "cacheable": True
     }
 
 async def add_numbers(a: float, b: float) -> list[types.TextContent]:
@@ -32,7 +32,8 @@ def register_text_tools(tool_registry):
                 }
             }
         ),
-        "handler": string_operations
+        "handler": string_operations,
+        "cacheable": True
     }
 
     tool_registry["word-count"] = {
@@ -50,7 +51,8 @@ def register_text_tools(tool_registry):
                 }
             }
         ),
-        "handler": word_count
+        "handler": word_count,
+        "cacheable": True
     }
 
     tool_registry["format-text"] = {
@@ -73,7 +75,8 @@ def register_text_tools(tool_registry):
                 }
             }
         ),
-        "handler": format_text
+        "handler": format_text,
+        "cacheable": True
     }
 
 async def string_operations(text: str, operation: str) -> list[types.TextContent]:
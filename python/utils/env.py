@@ -0,0 +1,26 @@
+"""Environment loading utilities for the MCP server."""
+
+import os
+from pathlib import Path
+from typing import Union
+
+def load_env_file(env_path: Union[str, Path]) -> None:
+    """Load KEY=VALUE pairs from a .env file into os.environ.
+    
+    Values in the file override variables already set in the environment.
+    Values are taken verbatim after the first '=' (no quote stripping or
+    inline comments), matching the loader in browser-use-mcp/server_http.py.
+    
+    Args:
+        env_path: Path to the .env file; missing files are ignored
+    """
+    env_path = Path(env_path)
+    if not env_path.exists():
+        return
+    
+    pairs = (line.strip().partition('=') for line in env_path.read_text().splitlines())
+    os.environ.update({
+        key.strip(): value.strip()
+        for key, sep, value in pairs
+        if sep and key and not key.startswith('#')
+    })
@@ -0,0 +1,30 @@
+"""Shared HTTP session for outbound requests made by tools."""
+
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_session: Optional[requests.Session] = None
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide requests session, creating it on first use.
+    
+    Reusing one session keeps TCP/TLS connections alive across tool calls
+    instead of opening a new connection per request.
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=100, pool_maxsize=200)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session = session
+    return _session
+
+def close_http_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
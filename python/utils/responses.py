@@ -0,0 +1,13 @@
+"""Response helpers for the Starlette endpoints."""
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)